@@ -14,8 +14,8 @@ Usage:
 
 from __future__ import annotations
 
-import io
 import json
+import shutil
 import sys
 import tarfile
 import urllib.error
@@ -25,6 +25,7 @@ from typing import Any
 
 NPM_REGISTRY_URL = "https://registry.npmjs.org/gltfpack"
 WASM_FILENAME = "library.wasm"
+WASM_MAGIC = b"\x00asm"
 BUNDLE_PATH = (
     Path(__file__).parent.parent / "src" / "notso_glb" / "wasm" / "gltfpack.wasm"
 )
@@ -63,29 +64,51 @@ def get_version_info(version: str | None = None) -> tuple[str, str]:
     return tarball_url, resolved_version
 
 
-def download_wasm(tarball_url: str) -> bytes:
+def download_wasm(tarball_url: str, dest: Path) -> int:
     """
     Download and extract WASM from npm tarball.
 
+    The member is streamed straight into ``dest``; only its 4-byte header is
+    held in memory for validation.
+
     Args:
         tarball_url: URL of the npm tarball to download.
+        dest: File to write the WASM binary to.
 
     Returns:
-        Raw WASM bytes.
+        Number of bytes written.
     """
-    with urllib.request.urlopen(tarball_url, timeout=60) as resp:
-        tarball_data = resp.read()
-
-    with tarfile.open(fileobj=io.BytesIO(tarball_data), mode="r:gz") as tar:
-        for member in tar.getmembers():
+    # Stream mode ("r|gz"): inflate while reading from the socket and stop at
+    # the first match instead of buffering and indexing the whole archive
+    with (
+        urllib.request.urlopen(tarball_url, timeout=60) as resp,
+        tarfile.open(fileobj=resp, mode="r|gz") as tar,
+    ):
+        for member in tar:
             if member.name.endswith(WASM_FILENAME):
                 f = tar.extractfile(member)
                 if f:
-                    return f.read()
+                    # Verify it's valid WASM (magic bytes: \0asm)
+                    header = f.read(len(WASM_MAGIC))
+                    if header != WASM_MAGIC:
+                        raise ValueError("Downloaded file is not valid WASM")
+                    with dest.open("wb") as out:
+                        _ = out.write(header)
+                        shutil.copyfileobj(f, out)
+                    return member.size
 
     raise FileNotFoundError(f"{WASM_FILENAME} not found in npm package")
 
 
+def has_valid_bundle() -> bool:
+    """Check the bundled WASM exists and starts with the WASM magic bytes."""
+    try:
+        with BUNDLE_PATH.open("rb") as f:
+            return f.read(len(WASM_MAGIC)) == WASM_MAGIC
+    except FileNotFoundError:
+        return False
+
+
 def get_bundled_version() -> str | None:
     """Get version of bundled WASM, or None if unknown."""
     if VERSION_PATH.exists():
@@ -106,24 +129,25 @@ def update_bundle(target_version: str | None = None) -> tuple[bool, str]:
     tarball_url, version = get_version_info(target_version)
     current_version = get_bundled_version()
 
-    # Skip download only if version matches AND wasm file exists
-    if current_version == version and target_version is None and BUNDLE_PATH.exists():
+    # Skip download only if version matches AND the bundled wasm is intact
+    if current_version == version and target_version is None and has_valid_bundle():
         return False, f"Already at latest version: {version}"
 
     print(f"[INFO] Downloading gltfpack WASM v{version} from npm...")
     print(f"[INFO] Source: {tarball_url}")
-    wasm_data = download_wasm(tarball_url)
-
-    # Verify it's valid WASM (magic bytes: \0asm)
-    if not wasm_data.startswith(b"\x00asm"):
-        raise ValueError("Downloaded file is not valid WASM")
 
-    # Update bundle
+    # Download next to the bundle, then swap it in so a failed or invalid
+    # download never clobbers the current file
     BUNDLE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _ = BUNDLE_PATH.write_bytes(wasm_data)
+    partial_path = BUNDLE_PATH.with_name(BUNDLE_PATH.name + ".part")
+    try:
+        size = download_wasm(tarball_url, partial_path)
+        _ = partial_path.replace(BUNDLE_PATH)
+    finally:
+        partial_path.unlink(missing_ok=True)
     _ = VERSION_PATH.write_text(f"{version}\n")
 
-    size_kb = len(wasm_data) / 1024
+    size_kb = size / 1024
     msg = f"Updated: {current_version or 'unknown'} -> {version} ({size_kb:.1f} KB)"
     return True, msg
 
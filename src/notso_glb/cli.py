@@ -211,6 +211,12 @@ def optimize(
         wasm_ok = wasm_available()
         gltfpack_available = native_available or wasm_ok
 
+        if wasm_ok and not native_available:
+            from notso_glb.wasm import prewarm
+
+            # Compile gltfpack while Blender imports and optimizes
+            prewarm()
+
         if gltfpack_available and use_draco:
             console.print(
                 "[bold yellow][WARN][/] Draco disabled for export "
@@ -96,9 +96,7 @@ def _resolve_output_path(input_path: Path, output_path: str | Path | None) -> Pa
     """Resolve output path, defaulting to input_packed.glb."""
     if output_path is not None:
         return Path(output_path)
-    stem = input_path.stem
-    if stem.endswith("_packed"):
-        stem = stem[:-7]
+    stem = input_path.stem.removesuffix("_packed")
     return input_path.parent / f"{stem}_packed{input_path.suffix}"
 
 
@@ -1,9 +1,11 @@
 """Colored logging and timing utilities for notso-glb."""
 
+import ctypes
 import os
 import sys
 import time
-from collections.abc import Iterator
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Final, final
@@ -42,15 +44,20 @@ class Colors:
 
 
 def _supports_color() -> bool:
-    """Check if terminal supports color output."""
-    if not hasattr(sys.stdout, "isatty"):
-        return False
-    if not sys.stdout.isatty():
+    """Check if terminal supports color output.
+
+    Honors the NO_COLOR / FORCE_COLOR conventions before probing stdout.
+    """
+    if os.environ.get("NO_COLOR"):
         return False
-    return True
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
 
 
 _USE_COLOR = _supports_color()
+_DEBUG_ENABLED = bool(os.environ.get("NOTSO_GLB_DEBUG"))
 
 
 def _c(color: str, text: str) -> str:
@@ -121,29 +128,40 @@ def bright_cyan(text: str) -> str:
 
 
 # Log level formatting
+# Level labels are constant for the process (color support is resolved at
+# import), so build them once instead of on every log call
+_PREFIX_INFO: Final = f"  {cyan('INFO')}  "
+_PREFIX_OK: Final = f"    {bright_green('OK')}  "
+_PREFIX_WARN: Final = f"  {bright_yellow('WARN')}  "
+_PREFIX_ERROR: Final = f" {bright_red('ERROR')}  "
+_PREFIX_DEBUG: Final = f" {dim('DEBUG')}  "
+
+
 def log_info(msg: str) -> None:
     """Print info message."""
-    print(f"  {cyan('INFO')}  {msg}")
+    print(_PREFIX_INFO + msg)
 
 
 def log_ok(msg: str) -> None:
     """Print success message."""
-    print(f"    {bright_green('OK')}  {msg}")
+    print(_PREFIX_OK + msg)
 
 
 def log_warn(msg: str) -> None:
     """Print warning message."""
-    print(f"  {bright_yellow('WARN')}  {msg}")
+    print(_PREFIX_WARN + msg)
 
 
 def log_error(msg: str) -> None:
     """Print error message."""
-    print(f" {bright_red('ERROR')}  {msg}")
+    print(_PREFIX_ERROR + msg)
 
 
 def log_debug(msg: str) -> None:
-    """Print debug message (dimmed)."""
-    print(f" {dim('DEBUG')}  {dim(msg)}")
+    """Print debug message (dimmed). No-op unless NOTSO_GLB_DEBUG is set."""
+    if not _DEBUG_ENABLED:
+        return
+    print(_PREFIX_DEBUG + dim(msg))
 
 
 def log_step(current: int, total: int, msg: str) -> None:
@@ -166,18 +184,14 @@ def log_timing(msg: str, seconds: float) -> None:
 # Separators and headers
 def print_header(title: str, char: str = "=", width: int = 60) -> None:
     """Print a header with decorative borders."""
-    border = char * width
-    print(f"\n{cyan(border)}")
-    print(f"  {bold(title)}")
-    print(f"{cyan(border)}")
+    border = cyan(char * width)
+    _ = sys.stdout.write(f"\n{border}\n  {bold(title)}\n{border}\n")
 
 
 def print_section(title: str, char: str = "-", width: int = 60) -> None:
     """Print a section header."""
-    border = char * width
-    print(f"\n{dim(border)}")
-    print(f"  {title}")
-    print(f"{dim(border)}")
+    border = dim(char * width)
+    _ = sys.stdout.write(f"\n{border}\n  {title}\n{border}\n")
 
 
 def print_warning_box(
@@ -186,29 +200,34 @@ def print_warning_box(
     """Print a warning box with colored border."""
     border_char = "!" if severity == "CRITICAL" else "~"
     color_fn = bright_red if severity == "CRITICAL" else bright_yellow
-    border = border_char * 60
+    border = color_fn(border_char * 60)
 
-    print(f"\n{color_fn(border)}")
-    print(f"  {color_fn(title)}")
-    print(f"{color_fn(border)}")
-    for w in warnings:
-        print(f"  {w}")
-    print(f"{color_fn(border)}")
+    lines = ["", border, f"  {color_fn(title)}", border]
+    lines.extend(f"  {w}" for w in warnings)
+    lines.append(border)
+    _ = sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Timing utilities
+# Upper bounds (exclusive) and (scale, format) for each duration bucket;
+# anything at or above the last bound is rendered as minutes + seconds
+_DURATION_BOUNDS: Final = (0.001, 1.0, 60.0)
+_DURATION_FORMATS: Final = (
+    (1000000.0, "{:.0f}μs"),
+    (1000.0, "{:.1f}ms"),
+    (1.0, "{:.2f}s"),
+)
+
+
 def format_duration(seconds: float) -> str:
     """Format seconds into human-readable duration."""
-    if seconds < 0.001:
-        return f"{seconds * 1000000:.0f}μs"
-    elif seconds < 1:
-        return f"{seconds * 1000:.1f}ms"
-    elif seconds < 60:
-        return f"{seconds:.2f}s"
-    else:
-        mins = int(seconds // 60)
-        secs = seconds % 60
-        return f"{mins}m {secs:.1f}s"
+    bucket = bisect_right(_DURATION_BOUNDS, seconds)
+    if bucket < len(_DURATION_FORMATS):
+        scale, fmt = _DURATION_FORMATS[bucket]
+        return fmt.format(seconds * scale)
+    mins = int(seconds // 60)
+    secs = seconds % 60
+    return f"{mins}m {secs:.1f}s"
 
 
 @dataclass
@@ -294,12 +313,11 @@ class StepTimer:
         print_section("Timing Summary", char="-", width=50)
         for name, elapsed in self.timings:
             time_str = format_duration(elapsed)
-            # Right-align timing
-            padding = 40 - len(name)
-            print(f"  {name}{' ' * max(1, padding)}{bright_cyan(time_str)}")
+            # Right-align timing (always at least one space after long names)
+            print(f"  {name.ljust(39)} {bright_cyan(time_str)}")
         print(f"{dim('-' * 50)}")
         total = self.total_elapsed()
-        print(f"  {bold('Total')}{' ' * 33}{bright_green(format_duration(total))}")
+        print(f"  {bold('Total'.ljust(38))}{bright_green(format_duration(total))}")
 
 
 # Result formatting
@@ -311,16 +329,22 @@ def format_count(count: int, singular: str, plural: str | None = None) -> str:
     return f"{count:,} {word}"
 
 
+# (shift, format) per power of 1024, indexed by (bit_length - 1) // 10
+_BYTE_FORMATS: Final = (
+    (0, "{:.0f} B"),
+    (10, "{:.1f} KB"),
+    (20, "{:.2f} MB"),
+    (30, "{:.2f} GB"),
+)
+
+
 def format_bytes(size: int) -> str:
     """Format byte size in human-readable form."""
     if size < 1024:
         return f"{size} B"
-    elif size < 1024 * 1024:
-        return f"{size / 1024:.1f} KB"
-    elif size < 1024 * 1024 * 1024:
-        return f"{size / 1024 / 1024:.2f} MB"
-    else:
-        return f"{size / 1024 / 1024 / 1024:.2f} GB"
+    index = min((size.bit_length() - 1) // 10, len(_BYTE_FORMATS) - 1)
+    shift, fmt = _BYTE_FORMATS[index]
+    return fmt.format(size / (1 << shift))
 
 
 def format_delta(before: int, after: int, unit: str = "") -> str:
@@ -334,18 +358,64 @@ def format_delta(before: int, after: int, unit: str = "") -> str:
         return bright_red(f"+{diff:,}{unit}")
 
 
-def _process_blender_output(output: str) -> None:
-    """Process captured Blender output, showing only warnings/errors."""
-    for line in output.splitlines():
+def _process_blender_output(output: Iterable[str]) -> None:
+    """Process captured Blender output line by line, showing only warnings/errors.
+
+    Kept lines are buffered and written to stdout in one call, so a noisy
+    export doesn't cost a write (and TTY flush) per warning.
+    """
+    kept: list[str] = []
+    for line in output:
         # Pass through warnings and errors with our formatting
-        if "| WARNING:" in line:
-            msg = line.split("| WARNING:", 1)[-1].strip()
-            log_warn(f"[Blender] {msg}")
-        elif "| ERROR:" in line:
-            msg = line.split("| ERROR:", 1)[-1].strip()
-            log_error(f"[Blender] {msg}")
+        _, sep, msg = line.partition("| WARNING:")
+        if sep:
+            kept.append(f"{_PREFIX_WARN}[Blender] {msg.strip()}\n")
+            continue
+        _, sep, msg = line.partition("| ERROR:")
+        if sep:
+            kept.append(f"{_PREFIX_ERROR}[Blender] {msg.strip()}\n")
         # Suppress: INFO lines, DracoDecoder lines, and other noise
         # (all other lines are discarded)
+    if kept:
+        _ = sys.stdout.write("".join(kept))
+        sys.stdout.flush()
+
+
+# Lazily resolved libc handle: None = not yet loaded, False = unavailable
+_libc: ctypes.CDLL | bool | None = None
+
+
+def _get_fflush() -> Callable[[int | None], int] | None:
+    """Return libc's fflush, loading it once per process (None if unavailable)."""
+    global _libc
+    if _libc is None:
+        try:
+            libc = ctypes.CDLL(None)
+            libc.fflush.argtypes = [ctypes.c_void_p]
+            libc.fflush.restype = ctypes.c_int
+            _libc = libc
+        except (OSError, AttributeError):
+            _libc = False  # Fallback: just use fsync
+    if isinstance(_libc, bool):
+        return None
+    return _libc.fflush
+
+
+def _wait_for_output_settle(
+    *fds: int, attempts: int = 10, interval: float = 0.005
+) -> None:
+    """Poll captured output files until their combined size stops changing.
+
+    Bounded by ``attempts * interval`` so a silent subprocess costs at most
+    the old fixed delay, while the common case returns after a few ms.
+    """
+    prev = -1
+    for _ in range(attempts):
+        cur = sum(os.fstat(fd).st_size for fd in fds)
+        if cur == prev and cur > 0:
+            break
+        prev = cur
+        time.sleep(interval)
 
 
 @contextmanager
@@ -381,18 +451,13 @@ def filter_blender_output() -> Iterator[None]:
     finally:
         # Flush ALL C-level stdio buffers (captures DracoDecoder subprocess output)
         # fflush(NULL) flushes all open output streams
-        import ctypes
-        import time
-
-        try:
-            libc = ctypes.CDLL(None)
-            libc.fflush(None)
-        except (OSError, AttributeError):
-            pass  # Fallback: just use fsync
+        fflush = _get_fflush()
+        if fflush is not None:
+            _ = fflush(None)
 
-        # Small delay to ensure subprocess output is flushed to temp files
-        # DracoDecoder subprocess may still be writing when export returns
-        time.sleep(0.05)
+        # DracoDecoder subprocess may still be writing when export returns;
+        # wait only until the captured output stops growing
+        _wait_for_output_settle(stdout_tmp.fileno(), stderr_tmp.fileno())
         os.fsync(stdout_fd)
         os.fsync(stderr_fd)
 
@@ -405,8 +470,8 @@ def filter_blender_output() -> Iterator[None]:
         # Read and process captured output
         _ = stdout_tmp.seek(0)
         _ = stderr_tmp.seek(0)
-        _process_blender_output(stdout_tmp.read())
-        _process_blender_output(stderr_tmp.read())
+        _process_blender_output(stdout_tmp)
+        _process_blender_output(stderr_tmp)
 
         stdout_tmp.close()
         stderr_tmp.close()
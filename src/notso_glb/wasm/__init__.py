@@ -1,27 +1,141 @@
-"""WASM-based gltfpack integration using wasmtime."""
+"""WASM-based gltfpack integration using wasmtime.
+
+Submodules (and wasmtime itself) are imported lazily so that CLI paths which
+never touch WASM don't pay for them.
+"""
 
 from __future__ import annotations
 
+import threading
+from functools import cache
+from importlib.util import find_spec
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
 
-from .runner import get_gltfpack, reset_gltfpack, run_gltfpack_wasm
-from .runtime import GltfpackWasm, get_wasm_path
+if TYPE_CHECKING:
+    from .runner import get_gltfpack
+    from .runner import pack_many
+    from .runner import reset_gltfpack
+    from .runtime import GltfpackWasm
+    from .runtime import get_wasm_path
 
 __all__ = [
     "GltfpackWasm",
     "get_gltfpack",
     "get_wasm_path",
     "is_available",
+    "pack_many",
+    "prewarm",
     "reset_gltfpack",
     "run_gltfpack_wasm",
 ]
 
+# Lazily resolved public names -> defining submodule
+_LAZY_EXPORTS: dict[str, str] = {
+    "GltfpackWasm": ".runtime",
+    "get_wasm_path": ".runtime",
+    "get_gltfpack": ".runner",
+    "pack_many": ".runner",
+    "reset_gltfpack": ".runner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _get_wasm_path() -> Path:
+    """Get path to bundled gltfpack.wasm."""
+    from .runtime import get_wasm_path
 
+    return get_wasm_path()
+
+
+@cache
 def is_available() -> bool:
-    """Check if WASM runtime (wasmtime) is importable and WASM exists."""
-    try:
-        import wasmtime  # noqa: F401
+    """Check if WASM runtime (wasmtime) is installed and WASM exists.
 
-        return get_wasm_path().exists()
-    except ImportError:
+    Uses ``find_spec`` so wasmtime is located without being imported. The
+    result is memoized for the process; call ``is_available.cache_clear()``
+    after installing wasmtime or downloading the WASM binary.
+    """
+    if find_spec("wasmtime") is None:
         return False
+    return _get_wasm_path().exists()
+
+
+def prewarm() -> threading.Thread | None:
+    """Compile gltfpack.wasm in a background daemon thread.
+
+    Opt-in: call this as soon as WASM packing is known to be needed so that
+    Cranelift compilation overlaps with other work instead of stalling the
+    first ``pack()``. Errors are left for that first ``pack()`` to report.
+
+    Returns:
+        The started thread, or None if WASM is unavailable
+    """
+    if not is_available():
+        return None
+
+    def _compile() -> None:
+        from .runtime import _get_compiled_module
+
+        try:
+            _get_compiled_module()
+        except Exception:
+            pass  # pack() recompiles and surfaces the error
+
+    thread = threading.Thread(target=_compile, name="gltfpack-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def run_gltfpack_wasm(
+    input_path: str | Path,
+    output_path: str | Path | None = None,
+    *,
+    texture_compress: bool = True,
+    mesh_compress: bool = True,
+    simplify_ratio: float | None = None,
+    texture_quality: int | None = None,
+) -> tuple[bool, Path, str]:
+    """
+    Run gltfpack via WASM on a GLB/glTF file.
+
+    Checks availability, then delegates to ``runner.run_gltfpack_wasm``.
+    See that function for argument details.
+
+    Returns:
+        Tuple of (success, output_path, message)
+    """
+    if not isinstance(input_path, Path):
+        input_path = Path(input_path)
+
+    if not is_available():
+        wasm_path = _get_wasm_path()
+        if not wasm_path.exists():
+            return (
+                False,
+                input_path,
+                f"WASM file not found at {wasm_path}. Run: uv run scripts/update_wasm.py",
+            )
+        return False, input_path, "WASM runtime not available (wasmtime not installed)"
+
+    from .runner import run_gltfpack_wasm as _run_gltfpack_wasm
+
+    return _run_gltfpack_wasm(
+        input_path,
+        output_path,
+        texture_compress=texture_compress,
+        mesh_compress=mesh_compress,
+        simplify_ratio=simplify_ratio,
+        texture_quality=texture_quality,
+    )
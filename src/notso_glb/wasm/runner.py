@@ -2,81 +2,105 @@
 
 from __future__ import annotations
 
+import mmap
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cache, partial
 from pathlib import Path
 
 from .runtime import GltfpackWasm
 
-# Singleton instance
-_gltfpack: GltfpackWasm | None = None
+# One instance per thread: pack() mutates per-call WASI state on the instance,
+# while the compiled module underneath is shared process-wide
+_local = threading.local()
 
 
 def get_gltfpack() -> GltfpackWasm:
-    """Get or create singleton GltfpackWasm instance."""
-    global _gltfpack
-    if _gltfpack is None:
-        _gltfpack = GltfpackWasm()
-    return _gltfpack
+    """Get or create this thread's GltfpackWasm instance."""
+    gltfpack: GltfpackWasm | None = getattr(_local, "gltfpack", None)
+    if gltfpack is None:
+        gltfpack = _local.gltfpack = GltfpackWasm()
+    return gltfpack
 
 
 def reset_gltfpack() -> None:
-    """Reset singleton instance (for testing/cleanup)."""
-    global _gltfpack
-    _gltfpack = None
+    """Reset this thread's instance (for testing/cleanup)."""
+    _local.gltfpack = None
 
 
 def _resolve_output_path(input_path: Path, output_path: str | Path | None) -> Path:
     """Resolve output path, defaulting to input_packed.glb."""
     if output_path is not None:
-        return Path(output_path)
-    stem = input_path.stem
-    if stem.endswith("_packed"):
-        stem = stem[:-7]
+        return output_path if isinstance(output_path, Path) else Path(output_path)
+    stem = input_path.stem.removesuffix("_packed")
     return input_path.parent / f"{stem}_packed{input_path.suffix}"
 
 
+@cache
 def _build_args(
     mesh_compress: bool,
     simplify_ratio: float | None,
-) -> tuple[list[str], str | None]:
-    """Build gltfpack args, return (args, error_message)."""
+) -> tuple[tuple[str, ...], str | None]:
+    """Build gltfpack args, return (args, error_message).
+
+    Memoized: batches reuse one flag set, and the resulting tuple also keys
+    the runtime's cache of encoded argv entries.
+    """
     args: list[str] = []
     if mesh_compress:
         args.append("-cc")
     if simplify_ratio is not None:
         if not (0.0 <= simplify_ratio <= 1.0):
-            return [], f"simplify_ratio must be [0.0, 1.0]: {simplify_ratio}"
+            return (), f"simplify_ratio must be [0.0, 1.0]: {simplify_ratio}"
         args.extend(["-si", str(simplify_ratio)])
-    return args, None
+    return tuple(args), None
+
+
+@contextmanager
+def _map_input(input_path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Map the input file read-only instead of copying it into a bytes object."""
+    with input_path.open("rb") as f:
+        # mmap rejects zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
 
 
 def _execute(
     input_path: Path,
     output_path: Path,
-    args: list[str],
+    args: tuple[str, ...],
 ) -> tuple[bool, Path, str]:
     """Execute gltfpack WASM and handle errors."""
     try:
         gltfpack = get_gltfpack()
-        input_data = input_path.read_bytes()
-        success, output_data, log = gltfpack.pack(
-            input_data,
-            input_name=input_path.name,
-            output_name=output_path.name,
-            args=args,
-        )
+        # Mapping must be closed before writing: output may overwrite input
+        with _map_input(input_path) as input_data:
+            success, output_data, log = gltfpack.pack(
+                input_data,
+                input_name=input_path.name,
+                output_name=output_path.name,
+                args=args,
+            )
+    except OSError as e:
+        return False, output_path, f"File I/O error: {e}"
+    except Exception as e:  # wasmtime traps/errors, WASI memory faults
+        return False, output_path, f"gltfpack WASM error: {e}"
 
-        if not success:
-            return False, output_path, f"gltfpack failed: {log}"
+    if not success:
+        return False, output_path, f"gltfpack failed: {log}"
 
+    try:
+        # write_bytes takes any buffer, so the output view is written uncopied
         output_path.write_bytes(output_data)
-        return True, output_path, "Success"
-
-    except UnicodeDecodeError as e:
-        return False, output_path, f"Log decode error: {e}"
     except OSError as e:
         return False, output_path, f"File I/O error: {e}"
-    except (ValueError, TypeError) as e:
-        return False, output_path, f"Argument error: {e}"
+    return True, output_path, "Success"
 
 
 def run_gltfpack_wasm(
@@ -101,28 +125,13 @@ def run_gltfpack_wasm(
 
     Returns:
         Tuple of (success, output_path, message)
-    """
-    from .runtime import get_wasm_path
-
-    input_path = Path(input_path)
 
-    # Check WASM availability inline to avoid circular import
-    wasm_path = get_wasm_path()
-    try:
-        import wasmtime  # noqa: F401
-
-        wasm_available = wasm_path.exists()
-    except ImportError:
-        wasm_available = False
-
-    if not wasm_available:
-        if not wasm_path.exists():
-            return (
-                False,
-                input_path,
-                f"WASM file not found at {wasm_path}. Run: uv run scripts/update_wasm.py",
-            )
-        return False, input_path, "WASM runtime not available (wasmtime not installed)"
+    Note:
+        Callers should check ``notso_glb.wasm.is_available()`` first; the
+        package-level ``run_gltfpack_wasm`` does this before delegating here.
+    """
+    if not isinstance(input_path, Path):
+        input_path = Path(input_path)
 
     if not input_path.is_file():
         return False, input_path, f"Input file not found: {input_path}"
@@ -142,3 +151,39 @@ def run_gltfpack_wasm(
         return False, input_path, error
 
     return _execute(input_path, resolved_output, args)
+
+
+def pack_many(
+    input_paths: Iterable[str | Path],
+    *,
+    max_workers: int | None = None,
+    texture_compress: bool = True,
+    mesh_compress: bool = True,
+    simplify_ratio: float | None = None,
+    texture_quality: int | None = None,
+) -> list[tuple[bool, Path, str]]:
+    """
+    Run gltfpack via WASM on several files in parallel.
+
+    Each worker thread packs with its own GltfpackWasm instance; all of them
+    share the compiled module, and wasmtime runs guest code without holding
+    the GIL. Outputs go to the default ``<stem>_packed`` paths.
+
+    Args:
+        input_paths: Input GLB/glTF files
+        max_workers: Thread count (default: ``os.cpu_count()``)
+        texture_compress, mesh_compress, simplify_ratio, texture_quality:
+            As for ``run_gltfpack_wasm``
+
+    Returns:
+        One (success, output_path, message) tuple per input, in input order
+    """
+    run = partial(
+        run_gltfpack_wasm,
+        texture_compress=texture_compress,
+        mesh_compress=mesh_compress,
+        simplify_ratio=simplify_ratio,
+        texture_quality=texture_quality,
+    )
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(run, input_paths))
@@ -2,243 +2,259 @@
 
 from __future__ import annotations
 
+import struct
+import threading
+from collections.abc import Sequence
+from functools import cache
+from itertools import accumulate
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
+from .wasi import FileData
 from .wasi import WasiExit
 from .wasi import WasiFilesystem
 
+if TYPE_CHECKING:
+    from wasmtime import Engine, Func, InstancePre, Module
 
+
+@cache
 def get_wasm_path() -> Path:
     """Get path to bundled gltfpack.wasm."""
     return Path(__file__).parent / "gltfpack.wasm"
 
 
+# Serializes first-time setup: pack_many() workers and prewarm() may race to
+# build the engine and module, and a Linker only accepts modules compiled for
+# its own Engine
+_init_lock = threading.RLock()
+
+
+def _get_engine() -> Engine:
+    """Get the shared wasmtime Engine (with on-disk compilation cache if usable)."""
+    with _init_lock:
+        return _create_engine()
+
+
+@cache
+def _create_engine() -> Engine:
+    from wasmtime import Config
+    from wasmtime import Engine
+    from wasmtime import WasmtimeError
+
+    config = Config()
+    # Map data segments copy-on-write, so fresh instances don't re-copy them
+    config.memory_init_cow = True
+    # Grow linear memory in place only; lets WasiFilesystem keep one view
+    # across calls instead of re-deriving it on every access
+    config.memory_may_move = False
+    # Let Cranelift compile functions on all cores
+    config.parallel_compilation = True
+    try:
+        # Persist Cranelift output so later processes skip compilation
+        config.cache = True
+    except WasmtimeError:
+        pass  # Cache directory unusable; compile in memory only
+    return Engine(config)
+
+
+def _get_compiled_module() -> Module:
+    """Compile gltfpack.wasm once per process and share it across instances."""
+    with _init_lock:
+        return _compile_module()
+
+
+@cache
+def _compile_module() -> Module:
+    from wasmtime import Module
+
+    return Module.from_file(_get_engine(), str(get_wasm_path()))
+
+
+def _encode_arg(arg: str) -> bytes:
+    """Encode one argv entry as a NUL-terminated C string."""
+    return arg.encode("utf-8") + b"\x00"
+
+
+@cache
+def _encode_args(args: tuple[str, ...]) -> tuple[bytes, ...]:
+    """Encode a flag set once; batches pass the same flags for every file."""
+    return tuple(map(_encode_arg, args))
+
+
+# WASI imports gltfpack needs: (name, i32 param count, i32 result count)
+_WASI_IMPORTS: tuple[tuple[str, int, int], ...] = (
+    ("proc_exit", 1, 0),
+    ("fd_close", 1, 1),
+    ("fd_fdstat_get", 2, 1),
+    ("path_open32", 9, 1),
+    ("path_filestat_get", 5, 1),
+    ("fd_prestat_get", 2, 1),
+    ("fd_prestat_dir_name", 3, 1),
+    ("path_remove_directory", 3, 1),
+    ("fd_fdstat_set_flags", 2, 1),
+    ("fd_seek32", 4, 1),
+    ("fd_read", 4, 1),
+    ("fd_write", 4, 1),
+)
+
+_ARGV_PROLOGUE = (_encode_arg("gltfpack"), _encode_arg("-i"))
+_ARGV_OUTPUT_FLAG = _encode_arg("-o")
+
+
 class GltfpackWasm(WasiFilesystem):
     """WASM-based gltfpack runner using wasmtime."""
 
-    def _get_export(self, name: str) -> Any:
-        """Get a named export from the WASM instance."""
-        exports: Any = self._instance.exports(self._store)  # type: ignore[union-attr]
-        return exports[name]
+    def __init__(self) -> None:
+        super().__init__()
+        self._pre: InstancePre | None = None
+        # Exports of the current instance, bound once in _instantiate()
+        self._fn_pack: Func | None = None
+        self._fn_malloc: Func | None = None
 
-    def _upload_argv(self, argv: list[str]) -> int:
-        """Upload argument vector to WASM memory."""
-        encoded_args = [arg.encode("utf-8") for arg in argv]
-        buf_size = len(argv) * 4
-        for arg in encoded_args:
-            buf_size += len(arg) + 1
+    def _upload_argv(self, encoded_args: Sequence[bytes]) -> int:
+        """Upload argument vector to WASM memory.
 
-        malloc = self._get_export("malloc")
-        buf: int = malloc(self._store, buf_size)
-        argp = buf + len(argv) * 4
+        ``encoded_args`` are NUL-terminated strings. The pointer table is
+        packed straight into guest memory and the strings follow it in a
+        single slice assignment, so no combined host-side blob is built.
+        """
+        argc = len(encoded_args)
+        table_size = argc * 4
+        strings = b"".join(encoded_args)
+        total = table_size + len(strings)
 
-        self._refresh_memory()
-        assert self._memory_array is not None
+        assert self._fn_malloc is not None
+        buf: int = self._fn_malloc(self._store, total)  # type: ignore[assignment]
+        # Each string starts where the previous one ended
+        pointers = accumulate(map(len, encoded_args[:-1]), initial=buf + table_size)
 
-        for i, arg in enumerate(encoded_args):
-            self._set_u32(buf + i * 4, argp)
-            # Copy string bytes
-            for j, b in enumerate(arg):
-                self._memory_array[argp + j] = b
-            self._set_u8(argp + len(arg), 0)
-            argp += len(arg) + 1
+        # malloc may have grown memory; validate (and refresh) the whole block
+        self._check_bounds("_upload_argv", buf, total)
+        assert self._memory_array is not None
+        struct.pack_into(f"<{argc}I", self._memory_array, buf, *pointers)
+        self._memory_array[buf + table_size : buf + total] = strings
 
         return buf
 
     def _initialize(self) -> None:
-        """Initialize WASM instance with wasmtime."""
-        if self._instance is not None:
+        """Link the shared module against the WASI shim (once per instance).
+
+        Host functions are defined store-independently, so the result is an
+        ``InstancePre`` that ``_instantiate`` can turn into a fresh Instance
+        cheaply for every ``pack()``.
+        """
+        if self._pre is not None:
             return
 
-        from wasmtime import Engine
-        from wasmtime import Func
         from wasmtime import FuncType
         from wasmtime import Linker
-        from wasmtime import Module
-        from wasmtime import Store
         from wasmtime import ValType
 
-        engine = Engine()
-        self._store = Store(engine)
-        wasm_bytes = get_wasm_path().read_bytes()
-        module = Module(engine, wasm_bytes)
+        linker = Linker(_get_engine())
 
-        linker = Linker(engine)
+        # Define WASI functions; each is handled by the wasi_<name> method
+        i32 = ValType.i32()
+        for name, params, results in _WASI_IMPORTS:
+            linker.define_func(
+                "wasi_snapshot_preview1",
+                name,
+                FuncType([i32] * params, [i32] * results),
+                getattr(self, f"wasi_{name}"),
+            )
 
-        # Define WASI functions
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "proc_exit",
-            Func(self._store, FuncType([ValType.i32()], []), self.wasi_proc_exit),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "fd_close",
-            Func(
-                self._store,
-                FuncType([ValType.i32()], [ValType.i32()]),
-                self.wasi_fd_close,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "fd_fdstat_get",
-            Func(
-                self._store,
-                FuncType([ValType.i32(), ValType.i32()], [ValType.i32()]),
-                self.wasi_fd_fdstat_get,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "path_open32",
-            Func(
-                self._store,
-                FuncType(
-                    [ValType.i32()] * 9,
-                    [ValType.i32()],
-                ),
-                self.wasi_path_open32,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "path_filestat_get",
-            Func(
-                self._store,
-                FuncType([ValType.i32()] * 5, [ValType.i32()]),
-                self.wasi_path_filestat_get,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "fd_prestat_get",
-            Func(
-                self._store,
-                FuncType([ValType.i32(), ValType.i32()], [ValType.i32()]),
-                self.wasi_fd_prestat_get,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "fd_prestat_dir_name",
-            Func(
-                self._store,
-                FuncType([ValType.i32()] * 3, [ValType.i32()]),
-                self.wasi_fd_prestat_dir_name,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "path_remove_directory",
-            Func(
-                self._store,
-                FuncType([ValType.i32()] * 3, [ValType.i32()]),
-                self.wasi_path_remove_directory,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "fd_fdstat_set_flags",
-            Func(
-                self._store,
-                FuncType([ValType.i32(), ValType.i32()], [ValType.i32()]),
-                self.wasi_fd_fdstat_set_flags,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "fd_seek32",
-            Func(
-                self._store,
-                FuncType([ValType.i32()] * 4, [ValType.i32()]),
-                self.wasi_fd_seek32,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "fd_read",
-            Func(
-                self._store,
-                FuncType([ValType.i32()] * 4, [ValType.i32()]),
-                self.wasi_fd_read,
-            ),
-        )
-        linker.define(
-            self._store,
-            "wasi_snapshot_preview1",
-            "fd_write",
-            Func(
-                self._store,
-                FuncType([ValType.i32()] * 4, [ValType.i32()]),
-                self.wasi_fd_write,
-            ),
-        )
+        self._pre = linker.instantiate_pre(_get_compiled_module())
 
-        self._instance = linker.instantiate(self._store, module)
+    def _instantiate(self) -> None:
+        """Create a fresh Store and Instance so no guest state leaks between packs."""
+        from wasmtime import Store
 
-        # Call constructors
+        assert self._pre is not None
+        self._store = Store(_get_engine())
+        self._instance = self._pre.instantiate(self._store)
+        self._memory_array = None
+
+        # Resolve every export the pack path needs with one exports() call
         exports: Any = self._instance.exports(self._store)
+        self._fn_pack = exports["pack"]
+        self._fn_malloc = exports["malloc"]
+        self._memory = exports["memory"]
+
+        # Call constructors
         ctors = exports.get("__wasm_call_ctors")
         if ctors:
             ctors(self._store)
 
     def pack(
         self,
-        input_data: bytes,
+        input_data: FileData,
         input_name: str = "input.glb",
         output_name: str = "output.glb",
-        args: list[str] | None = None,
-    ) -> tuple[bool, bytes, str]:
+        args: Sequence[str] | None = None,
+    ) -> tuple[bool, FileData, str]:
         """
         Run gltfpack on input data.
 
         Args:
-            input_data: Input GLB/glTF bytes
+            input_data: Input GLB/glTF bytes (or any read-only buffer, e.g. mmap)
             input_name: Virtual input filename
             output_name: Virtual output filename
             args: Additional gltfpack arguments
 
         Returns:
-            Tuple of (success, output_bytes, log_message)
+            Tuple of (success, output_data, log_message). ``output_data`` is
+            a zero-copy view of the virtual output file; write it out directly
+            rather than converting it to ``bytes``.
         """
         self._initialize()
+        self._instantiate()
         self._init_fds()
 
-        self._fs_interface = {input_name: input_data}
-
-        argv = ["gltfpack", "-i", input_name, "-o", output_name]
-        if args:
-            argv.extend(args)
+        # Encode each filename once: it keys the virtual filesystem (the WASI
+        # handlers match raw path bytes) and goes into argv
+        input_key = input_name.encode("utf-8")
+        output_key = output_name.encode("utf-8")
+        self._fs_interface = {input_key: input_data}
 
-        buf = self._upload_argv(argv)
+        # Only the filenames change between calls; the flags come pre-encoded
+        argv = (
+            *_ARGV_PROLOGUE,
+            input_key + b"\x00",
+            _ARGV_OUTPUT_FLAG,
+            output_key + b"\x00",
+            *_encode_args(tuple(args or ())),
+        )
 
-        pack_fn = self._get_export("pack")
         try:
-            result: int = pack_fn(self._store, len(argv), buf)
-        except WasiExit as e:
-            # WASI proc_exit was called; treat non-zero as failure
-            result = e.exit_code
+            buf = self._upload_argv(argv)
+
+            assert self._fn_pack is not None
+            try:
+                result: int = self._fn_pack(self._store, len(argv), buf)  # type: ignore[assignment]
+            except WasiExit as e:
+                # WASI proc_exit was called; treat non-zero as failure
+                result = e.exit_code
 
-        free_fn = self._get_export("free")
-        free_fn(self._store, buf)
+            output_data = self._fs_interface.get(output_key, b"")
+        finally:
+            # The instance is single-use; release its linear memory now
+            # instead of holding it until the next pack()
+            self._instance = None
+            self._store = None
+            self._fn_pack = None
+            self._fn_malloc = None
+            self._memory = None
+            self._memory_array = None
+            # Don't pin the input (possibly an mmap the caller is about to
+            # close) or the output buffer on this long-lived object; the
+            # caller holds the only reference to the result
+            self._fs_interface = None
+            self._fds = {}
 
         log = self._output_buffer.decode("utf-8", errors="replace")
 
         if result != 0:
             return False, b"", log
 
-        output_data = self._fs_interface.get(output_name, b"")
         return True, output_data, log
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import ctypes
+import mmap
+import struct
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import TypeAlias
 
 from .constants import WASI_EBADF
 from .constants import WASI_EFAULT
@@ -12,6 +16,36 @@ from .constants import WASI_EINVAL
 from .constants import WASI_EIO
 from .constants import WASI_ENOSYS
 
+# Contents of a virtual file: bytes, a read-only mapping of a real file, or a
+# view over a buffer written by the WASM module
+FileData: TypeAlias = bytes | mmap.mmap | memoryview
+
+_U32 = struct.Struct("<I")
+# fdstat_t: u8 fs_filetype, u16 fs_flags, u64 fs_rights_base,
+# u64 fs_rights_inheriting (24 bytes, 8-byte aligned)
+_FDSTAT = struct.Struct("<BxHxxxxQQ")
+# filestat_t: u64 dev, u64 ino, u8 filetype, u64 nlink, u64 size,
+# u64 atim, u64 mtim, u64 ctim (64 bytes)
+_FILESTAT = struct.Struct("<QQB7xQQQQQ")
+# prestat_t: u8 tag (0 = dir), u32 pr_name_len (8 bytes)
+_PRESTAT = struct.Struct("<B3xI")
+
+
+@dataclass(slots=True)
+class FdEntry:
+    """State of one open WASI file descriptor."""
+
+    kind: str = "file"  # "output" (stdout/stderr), "dir" (preopen) or "file"
+    name: bytes = b""
+    # Writable files own a bytearray; read-opens share the caller's buffer
+    data: bytearray | FileData = b""
+    size: int = 0
+    position: int = 0
+    # Publish data to the virtual filesystem on close (file was created)
+    close_data: bool = False
+    mount: bytes = b""
+    path: bytes = b""  # Path prefix for files opened under a preopen
+
 
 class WasiExit(Exception):
     """Exception raised when WASI proc_exit is called."""
@@ -31,32 +65,54 @@ class WasiFilesystem:
     def __init__(self) -> None:
         self._store: Store | None = None
         self._instance: Instance | None = None
-        self._fs_interface: dict[str, bytes] | None = None
+        # Virtual files keyed by raw path bytes, as the guest passes them
+        self._fs_interface: dict[bytes, FileData] | None = None
         self._output_buffer: bytearray = bytearray()
-        self._fds: dict[int, dict[str, Any]] = {}
-        self._memory_array: ctypes.Array | None = None
+        self._fds: dict[int, FdEntry] = {}
+        # Closed descriptors to hand out again, and the next never-used one
+        self._free_fds: list[int] = []
+        self._fd_counter: int = 5
+        self._memory: Memory | None = None
+        # Writable byte view over linear memory; slices copy in bulk
+        self._memory_array: memoryview | None = None
+        # Address and length the current view was built for
+        self._mem_base: int = 0
+        self._mem_size: int = 0
 
     def _init_fds(self) -> None:
         """Initialize file descriptors."""
         self._output_buffer = bytearray()
         self._fds = {
-            1: {"type": "output"},  # stdout
-            2: {"type": "output"},  # stderr
-            3: {"mount": "/", "path": "/"},
-            4: {"mount": "/gltfpack-$pwd", "path": ""},
+            1: FdEntry(kind="output"),  # stdout
+            2: FdEntry(kind="output"),  # stderr
+            3: FdEntry(kind="dir", mount=b"/", path=b"/"),
+            4: FdEntry(kind="dir", mount=b"/gltfpack-$pwd", path=b""),
         }
+        self._free_fds = []
+        self._fd_counter = 5
 
     def _next_fd(self) -> int:
-        """Get next available file descriptor."""
-        fd = 5
-        while fd in self._fds:
+        """Get next available file descriptor.
+
+        Reuses closed descriptors first, then continues from a counter, so
+        an open is O(1) rather than a scan over every open descriptor.
+        """
+        while self._free_fds:
+            fd = self._free_fds.pop()
+            if fd not in self._fds:
+                return fd
+        fd = self._fd_counter
+        while fd in self._fds:  # Only if a slot was claimed directly
             fd += 1
+        self._fd_counter = fd + 1
         return fd
 
     # Memory access methods
 
     def _get_memory(self) -> Memory:
-        """Get WASM memory export."""
+        """Get WASM memory export (looked up once per instance)."""
+        if self._memory is not None:
+            return self._memory
         if self._instance is None or self._store is None:
             raise RuntimeError("[ERROR] WASI runtime is not initialized")
         from wasmtime import Memory
@@ -64,36 +120,56 @@ class WasiFilesystem:
         exports: Any = self._instance.exports(self._store)
         memory = exports["memory"]
         assert isinstance(memory, Memory)
+        self._memory = memory
         return memory
 
     def _refresh_memory(self) -> None:
-        """Refresh memory array reference (needed after memory growth)."""
+        """Rebuild the memory array view (needed after memory growth).
+
+        The existing view is kept when linear memory has neither moved nor
+        grown since it was built.
+        """
         memory = self._get_memory()
         ptr = memory.data_ptr(self._store)  # type: ignore[arg-type]
         size = memory.data_len(self._store)  # type: ignore[arg-type]
-        self._memory_array = (ctypes.c_ubyte * size).from_address(
-            ctypes.addressof(ptr.contents)
-        )
+        base = ctypes.addressof(ptr.contents)
+        if (
+            self._memory_array is not None
+            and base == self._mem_base
+            and size == self._mem_size
+        ):
+            return
+        array = (ctypes.c_ubyte * size).from_address(base)
+        self._memory_array = memoryview(array).cast("B")
+        self._mem_base = base
+        self._mem_size = size
 
     def _check_bounds(self, func_name: str, offset: int, length: int) -> int:
-        """Validate memory access bounds, return memory length."""
-        self._refresh_memory()
-        assert self._memory_array is not None
-        mem_len = len(self._memory_array)
+        """Validate memory access bounds, return memory length.
+
+        Linear memory never moves (see ``_get_engine``), so the cached view
+        only goes stale by being too short after the guest grows its memory;
+        it is rebuilt on such a miss rather than on every access.
+        """
         if offset < 0:
             raise ValueError(f"{func_name}: negative offset {offset} (length={length})")
-        if offset + length > mem_len:
-            raise ValueError(
-                f"{func_name}: out of bounds offset={offset} length={length} "
-                f"exceeds memory size {mem_len}"
-            )
-        return mem_len
-
-    def _get_string(self, offset: int, length: int) -> str:
-        """Read string from WASM memory."""
-        self._check_bounds("_get_string", offset, length)
+        end = offset + length
+        if self._memory_array is None or end > len(self._memory_array):
+            self._refresh_memory()
+            assert self._memory_array is not None
+            mem_len = len(self._memory_array)
+            if end > mem_len:
+                raise ValueError(
+                    f"{func_name}: out of bounds offset={offset} length={length} "
+                    f"exceeds memory size {mem_len}"
+                )
+        return len(self._memory_array)
+
+    def _get_bytes(self, offset: int, length: int) -> bytes:
+        """Read raw bytes (e.g. a path) from WASM memory without decoding."""
+        self._check_bounds("_get_bytes", offset, length)
         assert self._memory_array is not None
-        return bytes(self._memory_array[offset : offset + length]).decode("utf-8")
+        return bytes(self._memory_array[offset : offset + length])
 
     def _set_u8(self, offset: int, value: int) -> None:
         """Write uint8 to WASM memory."""
@@ -105,15 +181,20 @@ class WasiFilesystem:
         """Write uint32 (little-endian) to WASM memory."""
         self._check_bounds("_set_u32", offset, 4)
         assert self._memory_array is not None
-        val_bytes = value.to_bytes(4, "little")
-        for i, b in enumerate(val_bytes):
-            self._memory_array[offset + i] = b
+        _U32.pack_into(self._memory_array, offset, value)
 
     def _get_u32(self, offset: int) -> int:
         """Read uint32 (little-endian) from WASM memory."""
         self._check_bounds("_get_u32", offset, 4)
         assert self._memory_array is not None
-        return int.from_bytes(bytes(self._memory_array[offset : offset + 4]), "little")
+        return _U32.unpack_from(self._memory_array, offset)[0]
+
+    def _get_iovecs(self, iovs: int, iovs_len: int) -> list[tuple[int, int]]:
+        """Read an iovec array as (buf, buf_len) pairs in a single unpack."""
+        self._check_bounds("_get_iovecs", iovs, 8 * iovs_len)
+        assert self._memory_array is not None
+        fields = struct.unpack_from(f"<{2 * iovs_len}I", self._memory_array, iovs)
+        return list(zip(fields[::2], fields[1::2], strict=True))
 
     # WASI syscall implementations
 
@@ -123,41 +204,33 @@ class WasiFilesystem:
 
     def wasi_fd_close(self, fd: int) -> int:
         """WASI fd_close syscall."""
-        if fd not in self._fds:
+        fd_info = self._fds.get(fd)
+        if fd_info is None:
             return WASI_EBADF
-        try:
-            fd_info = self._fds[fd]
-            if "close_data" in fd_info and self._fs_interface is not None:
-                name = fd_info.get("name", "")
-                data = fd_info["data"][: fd_info["size"]]
-                self._fs_interface[name] = bytes(data)
-            del self._fds[fd]
-            return 0
-        except (KeyError, TypeError, IndexError):
-            if fd in self._fds:
-                del self._fds[fd]
-            return WASI_EIO
+        del self._fds[fd]
+        if fd >= 5:  # 1-4 are stdio and preopens, never reissued
+            self._free_fds.append(fd)
+        if fd_info.close_data and self._fs_interface is not None:
+            # View over the write buffer; avoids copying the output file
+            self._fs_interface[fd_info.name] = memoryview(fd_info.data)[: fd_info.size]
+        return 0
 
     def wasi_fd_fdstat_get(self, fd: int, stat: int) -> int:
         """WASI fd_fdstat_get syscall."""
-        if fd not in self._fds:
+        fd_info = self._fds.get(fd)
+        if fd_info is None:
             return WASI_EBADF
         # Validate stat buffer can hold fdstat struct (24 bytes)
-        self._check_bounds("wasi_fd_fdstat_get", stat, 24)
-        fd_info = self._fds[fd]
+        self._check_bounds("wasi_fd_fdstat_get", stat, _FDSTAT.size)
         # Determine filetype: 2=char device, 3=directory, 4=regular file
-        if fd_info.get("type") == "output":
+        if fd_info.kind == "output":
             filetype = 2  # character device (stdout/stderr)
-        elif "path" in fd_info:
+        elif fd_info.kind == "dir":
             filetype = 3  # directory
         else:
             filetype = 4  # regular file
-        self._set_u8(stat + 0, filetype)
-        self._set_u32(stat + 2, 0)
-        self._set_u32(stat + 8, 0)
-        self._set_u32(stat + 12, 0)
-        self._set_u32(stat + 16, 0)
-        self._set_u32(stat + 20, 0)
+        assert self._memory_array is not None
+        _FDSTAT.pack_into(self._memory_array, stat, filetype, 0, 0, 0)
         return 0
 
     def wasi_path_open32(
@@ -173,25 +246,21 @@ class WasiFilesystem:
         opened_fd: int,
     ) -> int:
         """WASI path_open syscall (32-bit variant)."""
-        if parent_fd not in self._fds or "path" not in self._fds[parent_fd]:
+        parent = self._fds.get(parent_fd)
+        if parent is None or parent.kind != "dir":
             return WASI_EBADF
 
-        file_path = self._fds[parent_fd]["path"] + self._get_string(path, path_len)
-
-        file_info: dict[str, Any] = {
-            "name": file_path,
-            "position": 0,
-        }
+        file_path = parent.path + self._get_bytes(path, path_len)
 
         if oflags & 1:  # O_CREAT
-            file_info["data"] = bytearray(4096)
-            file_info["size"] = 0
-            file_info["close_data"] = True
+            file_info = FdEntry(name=file_path, data=bytearray(), close_data=True)
         else:
             if self._fs_interface is None or file_path not in self._fs_interface:
                 return WASI_EIO
-            file_info["data"] = bytearray(self._fs_interface[file_path])
-            file_info["size"] = len(file_info["data"])
+            # Read straight from the caller's buffer (e.g. an mmap of the
+            # input file); fd_read copies from it into guest memory once
+            data = self._fs_interface[file_path]
+            file_info = FdEntry(name=file_path, data=data, size=len(data))
 
         fd = self._next_fd()
         self._fds[fd] = file_info
@@ -202,45 +271,47 @@ class WasiFilesystem:
         self, parent_fd: int, flags: int, path: int, path_len: int, buf: int
     ) -> int:
         """WASI path_filestat_get syscall."""
-        if parent_fd not in self._fds or "path" not in self._fds[parent_fd]:
+        parent = self._fds.get(parent_fd)
+        if parent is None or parent.kind != "dir":
             return WASI_EBADF
 
-        name = self._get_string(path, path_len)
-        for i in range(64):
-            self._set_u8(buf + i, 0)
-
-        filetype = 3 if name == "." else 4
-        self._set_u8(buf + 16, filetype)
+        name = self._get_bytes(path, path_len)
+        filetype = 3 if name == b"." else 4
+        self._check_bounds("wasi_path_filestat_get", buf, _FILESTAT.size)
+        assert self._memory_array is not None
+        _FILESTAT.pack_into(self._memory_array, buf, 0, 0, filetype, 0, 0, 0, 0, 0)
         return 0
 
     def wasi_fd_prestat_get(self, fd: int, buf: int) -> int:
         """WASI fd_prestat_get syscall."""
-        if fd not in self._fds or "path" not in self._fds[fd]:
+        fd_info = self._fds.get(fd)
+        if fd_info is None or fd_info.kind != "dir":
             return WASI_EBADF
 
-        mount = self._fds[fd].get("mount", "").encode("utf-8")
-        self._set_u8(buf, 0)
-        self._set_u32(buf + 4, len(mount))
+        mount = fd_info.mount
+        self._check_bounds("wasi_fd_prestat_get", buf, _PRESTAT.size)
+        assert self._memory_array is not None
+        _PRESTAT.pack_into(self._memory_array, buf, 0, len(mount))
         return 0
 
     def wasi_fd_prestat_dir_name(self, fd: int, path: int, path_len: int) -> int:
         """WASI fd_prestat_dir_name syscall."""
-        if fd not in self._fds or "path" not in self._fds[fd]:
+        fd_info = self._fds.get(fd)
+        if fd_info is None or fd_info.kind != "dir":
             return WASI_EBADF
 
-        mount = self._fds[fd].get("mount", "").encode("utf-8")
+        mount = fd_info.mount
         if path_len != len(mount):
             return WASI_EINVAL
 
-        self._refresh_memory()
-        assert self._memory_array is not None
-
         # Bounds check: ensure destination range is within memory
-        if path < 0 or path + path_len > len(self._memory_array):
+        try:
+            self._check_bounds("wasi_fd_prestat_dir_name", path, path_len)
+        except ValueError:
             return WASI_EFAULT
+        assert self._memory_array is not None
 
-        for i, b in enumerate(mount):
-            self._memory_array[path + i] = b
+        self._memory_array[path : path + path_len] = mount
         return 0
 
     def wasi_path_remove_directory(
@@ -255,16 +326,16 @@ class WasiFilesystem:
 
     def wasi_fd_seek32(self, fd: int, offset: int, whence: int, newoffset: int) -> int:
         """WASI fd_seek syscall (32-bit variant)."""
-        if fd not in self._fds:
+        fd_info = self._fds.get(fd)
+        if fd_info is None:
             return WASI_EBADF
 
-        fd_info = self._fds[fd]
-        size = fd_info.get("size", 0)
+        size = fd_info.size
 
         if whence == 0:  # SEEK_SET
             new_pos = offset
         elif whence == 1:  # SEEK_CUR
-            new_pos = fd_info.get("position", 0) + offset
+            new_pos = fd_info.position + offset
         elif whence == 2:  # SEEK_END
             new_pos = size + offset
         else:
@@ -274,74 +345,76 @@ class WasiFilesystem:
         if new_pos < 0 or new_pos > size:
             return WASI_EINVAL
 
-        fd_info["position"] = new_pos
+        fd_info.position = new_pos
         self._set_u32(newoffset, new_pos)
         return 0
 
     def wasi_fd_read(self, fd: int, iovs: int, iovs_len: int, nread: int) -> int:
         """WASI fd_read syscall."""
-        if fd not in self._fds:
+        fd_info = self._fds.get(fd)
+        if fd_info is None:
             return WASI_EBADF
 
-        fd_info = self._fds[fd]
-        total_read = 0
-
-        for i in range(iovs_len):
-            buf = self._get_u32(iovs + 8 * i)
-            buf_len = self._get_u32(iovs + 8 * i + 4)
-
-            pos = fd_info.get("position", 0)
-            size = fd_info.get("size", 0)
-            data = fd_info.get("data", b"")
-
-            read_len = min(size - pos, buf_len)
-            if read_len > 0:
-                self._check_bounds("wasi_fd_read", buf, read_len)
-            assert self._memory_array is not None
-            for j in range(read_len):
-                self._memory_array[buf + j] = data[pos + j]
-
-            fd_info["position"] = pos + read_len
-            total_read += read_len
-
-        self._set_u32(nread, total_read)
+        pos = start = fd_info.position
+        size = fd_info.size
+
+        # One source view per call, released on return so an mmap-backed
+        # input can still be closed by the caller
+        with memoryview(fd_info.data) as src:
+            for buf, buf_len in self._get_iovecs(iovs, iovs_len):
+                read_len = min(size - pos, buf_len)
+                if read_len > 0:
+                    self._check_bounds("wasi_fd_read", buf, read_len)
+                    assert self._memory_array is not None
+                    self._memory_array[buf : buf + read_len] = src[pos : pos + read_len]
+                    pos += read_len
+
+        fd_info.position = pos
+        self._set_u32(nread, pos - start)
         return 0
 
     def wasi_fd_write(self, fd: int, iovs: int, iovs_len: int, nwritten: int) -> int:
         """WASI fd_write syscall."""
-        if fd not in self._fds:
+        fd_info = self._fds.get(fd)
+        if fd_info is None:
             return WASI_EBADF
 
-        fd_info = self._fds[fd]
-        total_written = 0
+        data: bytearray | None = None
+        if fd_info.kind != "output":
+            if not isinstance(fd_info.data, bytearray):
+                # Directory, or opened for reading: backed by the read-only
+                # input buffer
+                return WASI_EBADF
+            data = fd_info.data
 
-        for i in range(iovs_len):
-            buf = self._get_u32(iovs + 8 * i)
-            buf_len = self._get_u32(iovs + 8 * i + 4)
+        pos = fd_info.position
+        total_written = 0
 
+        for buf, buf_len in self._get_iovecs(iovs, iovs_len):
             if buf_len > 0:
                 self._check_bounds("wasi_fd_write", buf, buf_len)
             assert self._memory_array is not None
-            write_data = bytes(self._memory_array[buf : buf + buf_len])
+            # View into guest memory; consumers below copy it exactly once
+            write_data = self._memory_array[buf : buf + buf_len]
 
-            if fd_info.get("type") == "output":
+            if data is None:
+                # bytearray over-allocates on extend, so appends are amortized
+                # O(1); extending from the view skips any temporary bytes
                 self._output_buffer.extend(write_data)
             else:
-                pos = fd_info.get("position", 0)
-                data = fd_info.get("data", bytearray())
-
-                if pos + buf_len > len(data):
-                    new_len = max(len(data) * 2, pos + buf_len)
-                    new_data = bytearray(new_len)
-                    new_data[: len(data)] = data
-                    fd_info["data"] = new_data
-                    data = fd_info["data"]
-
+                if pos > len(data):
+                    # Seeked past the end: zero-fill the gap
+                    data.extend(bytes(pos - len(data)))
+                # Assigning past the end grows the bytearray in place, using
+                # its own amortized over-allocation
                 data[pos : pos + buf_len] = write_data
-                fd_info["position"] = pos + buf_len
-                fd_info["size"] = max(fd_info.get("size", 0), pos + buf_len)
+                pos += buf_len
 
             total_written += buf_len
 
+        if data is not None:
+            fd_info.position = pos
+            fd_info.size = max(fd_info.size, pos)
+
         self._set_u32(nwritten, total_written)
         return 0
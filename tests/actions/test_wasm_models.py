@@ -2,59 +2,109 @@
 
 from __future__ import annotations
 
+import io
+import os
 import sys
 from collections.abc import Generator
 from pathlib import Path
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 
-@pytest.fixture(autouse=True)
-def add_action_module_path() -> Generator[None, None, None]:
-    """Add the test-wasm-models action directory to sys.path for all tests."""
+@pytest.fixture(scope="module", autouse=True)
+def action_module() -> Generator[ModuleType, None, None]:
+    """Import the test-wasm-models action script (``test.py``) once per module.
+
+    Skips when the script cannot be imported. Tests patching ``test.*`` by
+    name resolve to this module, since it is the one in ``sys.modules``;
+    ``patch`` and ``monkeypatch`` restore those names after each test.
+    """
     action_path = str(
         Path(__file__).parent.parent.parent / ".github" / "actions" / "test-wasm-models"
     )
     sys.path.insert(0, action_path)
-    yield
-    sys.path.remove(action_path)
-    # Clear cached test module so patches apply fresh on next import
-    if "test" in sys.modules:
-        del sys.modules["test"]
+    try:
+        yield pytest.importorskip("test", reason="Test script not importable")
+    finally:
+        sys.path.remove(action_path)
+        # Don't leave the script shadowing the stdlib ``test`` package
+        sys.modules.pop("test", None)
+
+
+@pytest.fixture(scope="class")
+def wasm_scaffold(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """Build a read-only ``(wasm_file, model_dir)`` pair holding one ``test.glb``.
+
+    Shared by a test class; tests that add or change models use ``tmp_path``.
+    """
+    base = tmp_path_factory.mktemp("wasm_scaffold")
+    wasm_file = base / "gltfpack.wasm"
+    wasm_file.write_bytes(b"\x00asm")
+    model_dir = base / "models"
+    model_dir.mkdir()
+    (model_dir / "test.glb").write_bytes(b"data")
+    return wasm_file, model_dir
+
+
+def _fake_run_wasm(
+    _input_path: Path,
+    output_path: Path,
+    **_kwargs: object,
+) -> tuple[bool, Path, str]:
+    """Stand-in for run_gltfpack_wasm that creates the output file."""
+    output_path.write_bytes(b"packed")
+    return (True, output_path, "Success")
+
+
+@pytest.fixture
+def wasm_env(
+    action_module: ModuleType,
+    wasm_scaffold: tuple[Path, Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> SimpleNamespace:
+    """Stub the action script's WASM bindings for a successful run.
+
+    ``MODEL_DIR`` points at the shared scaffold. Returns a namespace holding
+    ``wasm_file``, ``model_dir`` and the ``run_wasm`` mock, whose default
+    side effect writes the output and reports success.
+    """
+    wasm_file, model_dir = wasm_scaffold
+    run_wasm = MagicMock(side_effect=_fake_run_wasm)
+
+    monkeypatch.setattr(action_module, "is_available", lambda: True)
+    monkeypatch.setattr(action_module, "get_wasm_path", lambda: wasm_file)
+    monkeypatch.setattr(action_module, "get_bundled_version", lambda: "1.0.0")
+    monkeypatch.setattr(action_module, "run_gltfpack_wasm", run_wasm)
+    monkeypatch.setattr(action_module, "MODEL_DIR", model_dir)
+
+    return SimpleNamespace(wasm_file=wasm_file, model_dir=model_dir, run_wasm=run_wasm)
 
 
 class TestGetBundledVersion:
     """Tests for get_bundled_version function."""
 
-    def test_returns_version_from_file(self, tmp_path: Path) -> None:
+    def test_returns_version_from_file(
+        self, action_module: ModuleType, tmp_path: Path
+    ) -> None:
         """Should return version from file."""
-        try:
-            from test import get_bundled_version  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
         version_file = tmp_path / "gltfpack.version"
         version_file.write_text("1.2.3\n")
 
         with patch("test.VERSION_PATH", version_file):
-            result = get_bundled_version()
+            result = action_module.get_bundled_version()
 
         assert result == "1.2.3"
 
-    def test_returns_unknown_when_missing(self, tmp_path: Path) -> None:
+    def test_returns_unknown_when_missing(
+        self, action_module: ModuleType, tmp_path: Path
+    ) -> None:
         """Should return 'unknown' when file doesn't exist."""
-        try:
-            from test import get_bundled_version  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
         version_file = tmp_path / "nonexistent.version"
 
         with patch("test.VERSION_PATH", version_file):
-            result = get_bundled_version()
+            result = action_module.get_bundled_version()
 
         assert result == "unknown"
 
@@ -62,379 +112,136 @@ class TestGetBundledVersion:
 class TestClassifyFailure:
     """Tests for classify_failure function."""
 
-    def test_identifies_external_resources(self) -> None:
-        """Should identify external resource failures."""
-        try:
-            from test import classify_failure  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        is_expected, category = classify_failure("Error: resource not found")
-
-        assert is_expected is True
-        assert category == "external-resources"
-
-    def test_identifies_draco_input(self) -> None:
-        """Should identify Draco input failures."""
-        try:
-            from test import classify_failure  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        is_expected, category = classify_failure("Draco compression error")
-
-        assert is_expected is True
-        assert category == "draco-input"
-
-    def test_identifies_missing_extension(self) -> None:
-        """Should identify missing extension failures."""
-        try:
-            from test import classify_failure  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        is_expected, category = classify_failure("file requires KHR_extension")
-
-        assert is_expected is True
-        assert category == "missing-extension"
-
-    def test_identifies_missing_feature(self) -> None:
-        """Should identify missing feature failures."""
-        try:
-            from test import classify_failure  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        is_expected, category = classify_failure("Model requires feature X")
-
-        assert is_expected is True
-        assert category == "missing-feature"
-
-    def test_identifies_unexpected_failure(self) -> None:
-        """Should identify unexpected failures."""
-        try:
-            from test import classify_failure  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        is_expected, category = classify_failure("Unknown error occurred")
-
-        assert is_expected is False
-        assert category == ""
+    @pytest.mark.parametrize(
+        ("message", "expected", "category"),
+        [
+            ("Error: resource not found", True, "external-resources"),
+            ("Draco compression error", True, "draco-input"),
+            ("file requires KHR_extension", True, "missing-extension"),
+            ("Model requires feature X", True, "missing-feature"),
+            ("Unknown error occurred", False, ""),
+        ],
+    )
+    def test_classifies_message(
+        self,
+        action_module: ModuleType,
+        message: str,
+        expected: bool,
+        category: str,
+    ) -> None:
+        """Should map each failure message to its expected category."""
+        assert action_module.classify_failure(message) == (expected, category)
 
 
 class TestMain:
     """Tests for main function."""
 
-    @patch("test.is_available")
-    def test_exits_when_wasm_unavailable(self, mock_is_avail: MagicMock) -> None:
+    def test_exits_when_wasm_unavailable(
+        self,
+        action_module: ModuleType,
+        wasm_env: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Should exit with error when WASM unavailable."""
-        try:
-            from test import main  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
+        monkeypatch.setattr(action_module, "is_available", lambda: False)
 
-        mock_is_avail.return_value = False
-
-        result = main()
+        result = action_module.main()
 
         assert result == 1
+        wasm_env.run_wasm.assert_not_called()
 
-    @patch("test.is_available")
-    @patch("test.get_wasm_path")
-    @patch("test.get_bundled_version")
     def test_displays_wasm_info(
         self,
-        mock_version: MagicMock,
-        mock_wasm_path: MagicMock,
-        mock_is_avail: MagicMock,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture[str],
+        action_module: ModuleType,
+        wasm_env: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Should display WASM version and path info."""
-        try:
-            from test import main  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        mock_is_avail.return_value = True
-        mock_version.return_value = "1.0.0"
-        wasm_file = tmp_path / "gltfpack.wasm"
-        wasm_file.write_bytes(b"\x00asm" + b"\x00" * 1024)
-        mock_wasm_path.return_value = wasm_file
-
-        # Create empty model dir
-        model_dir = tmp_path / "models"
-        model_dir.mkdir()
-
-        with patch("test.MODEL_DIR", model_dir):
-            main()
-
-        captured = capsys.readouterr()
-        assert "1.0.0" in captured.out
-        assert "gltfpack.wasm" in captured.out
-
-    def test_processes_glb_files(self, tmp_path: Path) -> None:
-        """Should process .glb files."""
-        import importlib
-
-        wasm_file = tmp_path / "gltfpack.wasm"
-        wasm_file.write_bytes(b"\x00asm")
-
-        # Create test model
-        model_dir = tmp_path / "models"
-        model_dir.mkdir()
-        model_file = model_dir / "test.glb"
-        model_file.write_bytes(b"fake glb data")
-
-        # Mock function that creates output file at the given path
-        def mock_run_wasm_impl(
-            _input_path: Path,
-            output_path: Path,
-            **_kwargs: object,
-        ) -> tuple[bool, Path, str]:
-            output_path.write_bytes(b"packed")
-            return (True, output_path, "Success")
-
-        # Clear cached test module to ensure fresh import with patches
-        if "test" in sys.modules:
-            del sys.modules["test"]
-
-        # Patch at source before importing test module
-        with (
-            patch("notso_glb.wasm.is_available", return_value=True),
-            patch("notso_glb.wasm.get_wasm_path", return_value=wasm_file),
-            patch(
-                "notso_glb.wasm.run_gltfpack_wasm",
-                side_effect=mock_run_wasm_impl,
-            ) as mock_run_wasm,
-        ):
-            try:
-                import test as test_module  # type: ignore[import-not-found]
-
-                importlib.reload(test_module)
-            except ImportError:
-                pytest.skip("Test script not importable")
-                return
-
-            with patch.object(test_module, "MODEL_DIR", model_dir):
-                with patch.object(test_module, "MAX_MODELS", 10):
-                    with patch.object(
-                        test_module, "get_bundled_version", return_value="1.0.0"
-                    ):
-                        result = test_module.main()
-
-            assert result == 0
-            mock_run_wasm.assert_called()
-
-    @patch("test.is_available")
-    @patch("test.get_wasm_path")
-    @patch("test.run_gltfpack_wasm")
-    def test_processes_gltf_files(
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stdout)
+
+        action_module.main()
+
+        output = stdout.getvalue()
+        assert "1.0.0" in output
+        assert "gltfpack.wasm" in output
+
+    @pytest.mark.parametrize(
+        ("filenames", "oversized", "max_models", "expected_calls"),
+        [
+            pytest.param(["test.glb"], False, 10, 1, id="glb"),
+            pytest.param(["test.gltf"], False, 10, 1, id="gltf"),
+            pytest.param(
+                [f"test{i}.glb" for i in range(5)], False, 2, 2, id="max-models"
+            ),
+            pytest.param(["large.glb"], True, 10, 0, id="skips-large"),
+        ],
+    )
+    def test_processes_models(
         self,
-        mock_run_wasm: MagicMock,
-        mock_wasm_path: MagicMock,
-        mock_is_avail: MagicMock,
+        action_module: ModuleType,
+        wasm_env: SimpleNamespace,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        filenames: list[str],
+        oversized: bool,
+        max_models: int,
+        expected_calls: int,
     ) -> None:
-        """Should process .gltf files."""
-        mock_is_avail.return_value = True
-        wasm_file = tmp_path / "gltfpack.wasm"
-        wasm_file.write_bytes(b"\x00asm")
-        mock_wasm_path.return_value = wasm_file
-
-        # Create test model
+        """Should pack up to MAX_MODELS .glb/.gltf files under MAX_FILE_SIZE."""
         model_dir = tmp_path / "models"
         model_dir.mkdir()
-        model_file = model_dir / "test.gltf"
-        model_file.write_bytes(b"fake gltf data")
-
-        # Mock function that creates output file at the given path
-        def mock_run_wasm_impl(
-            _input_path: Path,
-            output_path: Path,
-            **_kwargs: object,
-        ) -> tuple[bool, Path, str]:
-            output_path.write_bytes(b"packed")
-            return (True, output_path, "Success")
-
-        mock_run_wasm.side_effect = mock_run_wasm_impl
-
-        try:
-            from test import main  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        with patch("test.MODEL_DIR", model_dir):
-            with patch("test.MAX_MODELS", 10):
-                with patch("test.get_bundled_version", return_value="1.0.0"):
-                    result = main()
+        # Sparse files: only the logical size is inspected; extra models
+        # are hardlinks to the first
+        first_model = model_dir / filenames[0]
+        first_model.touch()
+        size = action_module.MAX_FILE_SIZE + 1 if oversized else 16
+        os.truncate(first_model, size)
+        for name in filenames[1:]:
+            os.link(first_model, model_dir / name)
+        monkeypatch.setattr(action_module, "MODEL_DIR", model_dir)
+        monkeypatch.setattr(action_module, "MAX_MODELS", max_models)
+
+        result = action_module.main()
 
         assert result == 0
-
-    @patch("test.is_available")
-    @patch("test.get_wasm_path")
-    @patch("test.get_bundled_version")
-    @patch("test.run_gltfpack_wasm")
-    def test_respects_max_models_limit(
-        self,
-        mock_run_wasm: MagicMock,
-        mock_version: MagicMock,
-        mock_wasm_path: MagicMock,
-        mock_is_avail: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """Should respect MAX_MODELS limit."""
-        try:
-            from test import main  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        mock_is_avail.return_value = True
-        mock_version.return_value = "1.0.0"
-        wasm_file = tmp_path / "gltfpack.wasm"
-        wasm_file.write_bytes(b"\x00asm")
-        mock_wasm_path.return_value = wasm_file
-
-        # Create 5 test models
-        model_dir = tmp_path / "models"
-        model_dir.mkdir()
-        for i in range(5):
-            model_file = model_dir / f"test{i}.glb"
-            model_file.write_bytes(b"fake glb")
-
-        mock_run_wasm.return_value = (True, tmp_path / "out.glb", "Success")
-
-        with patch("test.MODEL_DIR", model_dir):
-            with patch("test.MAX_MODELS", 2):  # Only process 2
-                main()
-
-        assert mock_run_wasm.call_count == 2
-
-    @patch("test.is_available")
-    @patch("test.get_wasm_path")
-    @patch("test.get_bundled_version")
-    @patch("test.run_gltfpack_wasm")
-    def test_skips_large_files(
-        self,
-        mock_run_wasm: MagicMock,
-        mock_version: MagicMock,
-        mock_wasm_path: MagicMock,
-        mock_is_avail: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """Should skip files larger than MAX_FILE_SIZE."""
-        try:
-            from test import MAX_FILE_SIZE, main  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        mock_is_avail.return_value = True
-        mock_version.return_value = "1.0.0"
-        wasm_file = tmp_path / "gltfpack.wasm"
-        wasm_file.write_bytes(b"\x00asm")
-        mock_wasm_path.return_value = wasm_file
-
-        # Create large model
-        model_dir = tmp_path / "models"
-        model_dir.mkdir()
-        large_file = model_dir / "large.glb"
-        large_file.write_bytes(b"x" * (MAX_FILE_SIZE + 1))
-
-        with patch("test.MODEL_DIR", model_dir):
-            main()
-
-        # Should not call run_gltfpack_wasm for large file
-        mock_run_wasm.assert_not_called()
-
-    @patch("test.is_available")
-    @patch("test.get_wasm_path")
-    @patch("test.get_bundled_version")
-    @patch("test.run_gltfpack_wasm")
+        assert wasm_env.run_wasm.call_count == expected_calls
+
+    @pytest.mark.parametrize(
+        "side_effect",
+        [
+            pytest.param(
+                lambda path, *_args, **_kwargs: (False, path, "Unexpected error"),
+                id="unexpected-failure",
+            ),
+            pytest.param(Exception("Unexpected error"), id="exception"),
+        ],
+    )
     def test_returns_error_on_unexpected_failures(
         self,
-        mock_run_wasm: MagicMock,
-        mock_version: MagicMock,
-        mock_wasm_path: MagicMock,
-        mock_is_avail: MagicMock,
-        tmp_path: Path,
+        action_module: ModuleType,
+        wasm_env: SimpleNamespace,
+        side_effect: object,
     ) -> None:
-        """Should return error when unexpected failures occur."""
-        try:
-            from test import main  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        mock_is_avail.return_value = True
-        mock_version.return_value = "1.0.0"
-        wasm_file = tmp_path / "gltfpack.wasm"
-        wasm_file.write_bytes(b"\x00asm")
-        mock_wasm_path.return_value = wasm_file
-
-        # Create test model
-        model_dir = tmp_path / "models"
-        model_dir.mkdir()
-        model_file = model_dir / "test.glb"
-        model_file.write_bytes(b"data")
-
-        # Simulate unexpected failure
-        mock_run_wasm.return_value = (False, model_file, "Unexpected error")
+        """Should record failures and exceptions as unexpected and return 1."""
+        wasm_env.run_wasm.side_effect = side_effect
 
-        with patch("test.MODEL_DIR", model_dir):
-            result = main()
+        result = action_module.main()
 
         assert result == 1
 
-    @patch("test.is_available")
-    @patch("test.get_wasm_path")
-    @patch("test.get_bundled_version")
-    @patch("test.run_gltfpack_wasm")
     def test_writes_github_output(
         self,
-        mock_run_wasm: MagicMock,
-        mock_version: MagicMock,
-        mock_wasm_path: MagicMock,
-        mock_is_avail: MagicMock,
+        action_module: ModuleType,
+        wasm_env: SimpleNamespace,
         tmp_path: Path,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Should write results to GITHUB_OUTPUT."""
-        try:
-            from test import main  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        mock_is_avail.return_value = True
-        mock_version.return_value = "1.0.0"
-        wasm_file = tmp_path / "gltfpack.wasm"
-        wasm_file.write_bytes(b"\x00asm")
-        mock_wasm_path.return_value = wasm_file
-
-        # Create test model
-        model_dir = tmp_path / "models"
-        model_dir.mkdir()
-        model_file = model_dir / "test.glb"
-        model_file.write_bytes(b"data")
-
-        mock_run_wasm.return_value = (True, tmp_path / "out.glb", "Success")
-
         github_output = tmp_path / "github_output.txt"
         monkeypatch.setenv("GITHUB_OUTPUT", str(github_output))
 
-        with patch("test.MODEL_DIR", model_dir):
-            main()
+        action_module.main()
 
         # Check output file was written
         assert github_output.exists()
@@ -443,63 +250,17 @@ class TestMain:
         assert "expected-failed=" in content
         assert "unexpected-failed=" in content
 
-    @patch("test.is_available")
-    @patch("test.get_wasm_path")
-    @patch("test.get_bundled_version")
-    @patch("test.run_gltfpack_wasm")
-    def test_handles_exceptions_gracefully(
-        self,
-        mock_run_wasm: MagicMock,
-        mock_version: MagicMock,
-        mock_wasm_path: MagicMock,
-        mock_is_avail: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """Should handle exceptions during processing."""
-        try:
-            from test import main  # type: ignore[import-not-found]
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        mock_is_avail.return_value = True
-        mock_version.return_value = "1.0.0"
-        wasm_file = tmp_path / "gltfpack.wasm"
-        wasm_file.write_bytes(b"\x00asm")
-        mock_wasm_path.return_value = wasm_file
-
-        # Create test model
-        model_dir = tmp_path / "models"
-        model_dir.mkdir()
-        model_file = model_dir / "test.glb"
-        model_file.write_bytes(b"data")
-
-        # Simulate exception
-        mock_run_wasm.side_effect = Exception("Unexpected error")
-
-        with patch("test.MODEL_DIR", model_dir):
-            result = main()
-
-        # Should catch exception and record as unexpected failure
-        assert result == 1
-
 
 class TestCategoryDescriptions:
     """Tests for CATEGORY_DESCRIPTIONS mapping."""
 
-    def test_all_categories_have_descriptions(self) -> None:
+    def test_all_categories_have_descriptions(self, action_module: ModuleType) -> None:
         """All expected failure categories should have descriptions."""
-        try:
-            from test import (  # type: ignore[import-not-found]
-                CATEGORY_DESCRIPTIONS,
-                EXPECTED_FAILURES,
-            )
-        except ImportError:
-            pytest.skip("Test script not importable")
-            return
-
-        categories = {cat for _, cat in EXPECTED_FAILURES}
-
-        for category in categories:
-            assert category in CATEGORY_DESCRIPTIONS
-            assert len(CATEGORY_DESCRIPTIONS[category]) > 0
+        categories = {cat for _, cat in action_module.EXPECTED_FAILURES}
+        descriptions = action_module.CATEGORY_DESCRIPTIONS
+
+        missing = categories - descriptions.keys()
+        empty = {cat for cat in categories if not descriptions.get(cat)}
+
+        assert not missing, f"Missing descriptions: {missing}"
+        assert not empty, f"Empty descriptions: {empty}"
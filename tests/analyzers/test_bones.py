@@ -1,6 +1,7 @@
 """Tests for bone analysis module."""
 
 from bpy.types import Object
+from notso_glb.analyzers import get_bones_used_for_skinning
 
 
 class TestGetBonesUsedForSkinning:
@@ -8,13 +9,9 @@ class TestGetBonesUsedForSkinning:
 
     def test_no_skinned_meshes(self, cube_mesh: Object) -> None:
         """Scene without skinned meshes should return empty set."""
-        from notso_glb.analyzers import get_bones_used_for_skinning
-
         assert get_bones_used_for_skinning() == set()
 
     def test_skinned_mesh_returns_bone_names(self, skinned_mesh: Object) -> None:
         """Skinned mesh should return vertex group names as bone names."""
-        from notso_glb.analyzers import get_bones_used_for_skinning
-
         bones = get_bones_used_for_skinning()
         assert len(bones) >= 1
@@ -1,15 +1,9 @@
 """Tests for duplicate name analysis module."""
 
-import bpy
-from bpy.types import Object
-
+from collections.abc import Callable
 
-def _active_object() -> Object:
-    """Get the active object, raising if None."""
-    obj = bpy.context.active_object
-    if obj is None:
-        raise RuntimeError("No active object")
-    return obj
+from bpy.types import Object
+from notso_glb.analyzers import analyze_duplicate_names
 
 
 class TestAnalyzeDuplicateNames:
@@ -17,20 +11,16 @@ class TestAnalyzeDuplicateNames:
 
     def test_no_duplicates(self, cube_mesh: Object) -> None:
         """Scene with unique names should return empty or minimal list."""
-        from notso_glb.analyzers import analyze_duplicate_names
-
         duplicates = analyze_duplicate_names()
         exact_dups = [d for d in duplicates if d["issue"] == "EXACT_DUPLICATE"]
         assert len(exact_dups) == 0
 
-    def test_detects_sanitization_collision(self) -> None:
+    def test_detects_sanitization_collision(
+        self, make_named_object: Callable[[str], Object]
+    ) -> None:
         """Names that collide after sanitization should be detected."""
-        from notso_glb.analyzers import analyze_duplicate_names
-
-        bpy.ops.mesh.primitive_cube_add()
-        _active_object().name = "Cube.001"
-        bpy.ops.mesh.primitive_cube_add()
-        _active_object().name = "Cube_001"
+        make_named_object("Cube.001")
+        make_named_object("Cube_001")
 
         duplicates = analyze_duplicate_names()
         collision = [d for d in duplicates if d["issue"] == "SANITIZATION_COLLISION"]
@@ -38,8 +28,6 @@ class TestAnalyzeDuplicateNames:
 
     def test_detects_bone_duplicates(self, armature_with_bones: Object) -> None:
         """Duplicate bone names within armature should be detected."""
-        from notso_glb.analyzers import analyze_duplicate_names
-
         duplicates = analyze_duplicate_names()
         bone_dups = [d for d in duplicates if d["type"] == "BONE"]
         assert isinstance(bone_dups, list)
@@ -1,15 +1,10 @@
 """Tests for duplicate name cleanup module."""
 
+from collections.abc import Callable
+
 import bpy
 from bpy.types import Object
-
-
-def _active_object() -> Object:
-    """Get the active object, raising if None."""
-    obj = bpy.context.active_object
-    if obj is None:
-        raise RuntimeError("No active object")
-    return obj
+from notso_glb.cleaners import auto_fix_duplicate_names
 
 
 class TestAutoFixDuplicateNames:
@@ -17,25 +12,19 @@ class TestAutoFixDuplicateNames:
 
     def test_empty_duplicates(self) -> None:
         """Empty duplicate list should return empty renames."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         assert auto_fix_duplicate_names([]) == []
 
     def test_skips_bone_duplicates(self) -> None:
         """Bone duplicates should be skipped."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         duplicates = [{"type": "BONE", "name": "Armature/Bone", "count": 2}]
         assert auto_fix_duplicate_names(duplicates) == []
 
-    def test_fixes_sanitization_collision(self) -> None:
+    def test_fixes_sanitization_collision(
+        self, make_named_object: Callable[[str], Object]
+    ) -> None:
         """Should rename objects that collide after sanitization."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
-        bpy.ops.mesh.primitive_cube_add()
-        _active_object().name = "Test.001"
-        bpy.ops.mesh.primitive_cube_add()
-        _active_object().name = "Test_001"
+        make_named_object("Test.001")
+        make_named_object("Test_001")
 
         duplicates = [
             {
@@ -54,8 +43,6 @@ class TestAutoFixDuplicateNames:
 
     def test_fixes_exact_duplicates(self) -> None:
         """Should rename exact duplicate objects."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         mesh1 = bpy.data.meshes.new("DupMesh")
         mesh2 = bpy.data.meshes.new("DupMesh")
 
@@ -73,13 +60,11 @@ class TestAutoFixDuplicateNames:
             assert len(renames) >= 0
 
         bpy.data.meshes.remove(mesh1)
-        if mesh2.name in [m.name for m in bpy.data.meshes]:
+        if mesh2.name in bpy.data.meshes:
             bpy.data.meshes.remove(mesh2)
 
     def test_skips_unknown_collection_type(self) -> None:
         """Should skip unknown collection types gracefully."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         duplicates = [
             {
                 "type": "UNKNOWN_TYPE",
@@ -94,8 +79,6 @@ class TestAutoFixDuplicateNames:
 
     def test_fixes_material_duplicates(self) -> None:
         """Should rename duplicate materials."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         mat1 = bpy.data.materials.new("Material")
         mat2 = bpy.data.materials.new("Material")
 
@@ -114,13 +97,11 @@ class TestAutoFixDuplicateNames:
             assert len(renames) >= 0
 
         bpy.data.materials.remove(mat1)
-        if mat2.name in [m.name for m in bpy.data.materials]:
+        if mat2.name in bpy.data.materials:
             bpy.data.materials.remove(mat2)
 
     def test_fixes_action_duplicates(self) -> None:
         """Should rename duplicate actions."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         action1 = bpy.data.actions.new("Action")
         action2 = bpy.data.actions.new("Action")
 
@@ -138,13 +119,11 @@ class TestAutoFixDuplicateNames:
             assert len(renames) >= 0
 
         bpy.data.actions.remove(action1)
-        if action2.name in [a.name for a in bpy.data.actions]:
+        if action2.name in bpy.data.actions:
             bpy.data.actions.remove(action2)
 
     def test_multiple_exact_duplicates(self) -> None:
         """Should rename multiple exact duplicates with different suffixes."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         mesh1 = bpy.data.meshes.new("MultiDup")
         mesh2 = bpy.data.meshes.new("MultiDup")
         mesh3 = bpy.data.meshes.new("MultiDup")
@@ -168,13 +147,11 @@ class TestAutoFixDuplicateNames:
             assert len(renamed_names) == len(set(renamed_names))
 
         for mesh in [mesh1, mesh2, mesh3]:
-            if mesh.name in [m.name for m in bpy.data.meshes]:
+            if mesh.name in bpy.data.meshes:
                 bpy.data.meshes.remove(mesh)
 
     def test_processes_each_duplicate_once(self) -> None:
         """Should not process the same duplicate multiple times."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         mesh1 = bpy.data.meshes.new("OnceMesh")
         mesh2 = bpy.data.meshes.new("OnceMesh")
 
@@ -200,19 +177,16 @@ class TestAutoFixDuplicateNames:
             assert len(renames) <= 2
 
         for mesh in [mesh1, mesh2]:
-            if mesh.name in [m.name for m in bpy.data.meshes]:
+            if mesh.name in bpy.data.meshes:
                 bpy.data.meshes.remove(mesh)
 
-    def test_sanitization_with_multiple_collisions(self) -> None:
+    def test_sanitization_with_multiple_collisions(
+        self, make_named_object: Callable[[str], Object]
+    ) -> None:
         """Should handle multiple sanitization collisions."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
-        bpy.ops.mesh.primitive_cube_add()
-        _active_object().name = "Obj.A"
-        bpy.ops.mesh.primitive_cube_add()
-        _active_object().name = "Obj_A"
-        bpy.ops.mesh.primitive_cube_add()
-        _active_object().name = "Obj.B"
+        make_named_object("Obj.A")
+        make_named_object("Obj_A")
+        make_named_object("Obj.B")
 
         duplicates = [
             {
@@ -228,8 +202,6 @@ class TestAutoFixDuplicateNames:
 
     def test_empty_collection_name_handling(self) -> None:
         """Should handle empty or malformed collision names."""
-        from notso_glb.cleaners import auto_fix_duplicate_names
-
         duplicates = [
             {
                 "type": "OBJECT",
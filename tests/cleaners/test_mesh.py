@@ -1,6 +1,7 @@
 """Tests for mesh cleanup module."""
 
 from bpy.types import Object
+from notso_glb.cleaners import cleanup_mesh_bmesh
 
 
 class TestCleanupMeshBmesh:
@@ -8,8 +9,6 @@ class TestCleanupMeshBmesh:
 
     def test_clean_mesh_no_changes(self, cube_mesh: Object) -> None:
         """Clean mesh should have no changes."""
-        from notso_glb.cleaners import cleanup_mesh_bmesh
-
         stats = cleanup_mesh_bmesh(cube_mesh)
         assert stats is not None
 
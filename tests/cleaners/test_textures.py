@@ -1,6 +1,7 @@
 """Tests for texture cleanup module."""
 
 import bpy
+from notso_glb.cleaners import resize_textures
 
 
 class TestResizeTextures:
@@ -8,14 +9,10 @@ class TestResizeTextures:
 
     def test_no_images(self) -> None:
         """Empty image list should return 0."""
-        from notso_glb.cleaners import resize_textures
-
         assert resize_textures() == 0
 
     def test_skips_small_images(self) -> None:
         """Images within max_size should not be resized."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("SmallTex", width=512, height=512)
 
         resized = resize_textures(max_size=1024)
@@ -25,8 +22,6 @@ class TestResizeTextures:
 
     def test_resizes_large_images(self, large_texture: bpy.types.Image) -> None:
         """Images larger than max_size should be resized."""
-        from notso_glb.cleaners import resize_textures
-
         resized = resize_textures(max_size=1024)
         assert resized == 1
         assert large_texture.size[0] <= 1024
@@ -34,8 +29,6 @@ class TestResizeTextures:
 
     def test_force_pot_rounds_to_power_of_two(self) -> None:
         """force_pot should round dimensions to power of two."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("NonPOT", width=1500, height=1500)
 
         resized = resize_textures(max_size=2048, force_pot=True)
@@ -48,8 +41,6 @@ class TestResizeTextures:
 
     def test_force_pot_clamps_to_max_size(self) -> None:
         """force_pot should clamp to max_size."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("LargePOT", width=4096, height=4096)
 
         resized = resize_textures(max_size=1024, force_pot=True)
@@ -61,8 +52,6 @@ class TestResizeTextures:
 
     def test_maintains_aspect_ratio(self) -> None:
         """Should maintain aspect ratio when resizing."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("Rectangular", width=2048, height=1024)
 
         resized = resize_textures(max_size=1024, force_pot=False)
@@ -75,8 +64,6 @@ class TestResizeTextures:
 
     def test_adjusts_to_even_dimensions(self) -> None:
         """Should adjust to even dimensions when not force_pot."""
-        from notso_glb.cleaners import resize_textures
-
         # Create image with odd dimensions after scaling
         img = bpy.data.images.new("OddSize", width=1500, height=900)
 
@@ -90,8 +77,6 @@ class TestResizeTextures:
 
     def test_skips_render_result_image(self) -> None:
         """Should skip special Render Result image."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("UserImage", width=2048, height=2048)
         render_result = bpy.data.images.new("Render Result", width=2048, height=2048)
 
@@ -105,8 +90,6 @@ class TestResizeTextures:
 
     def test_skips_already_pot_images_when_force_pot(self) -> None:
         """Should skip images that are already power-of-two."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("AlreadyPOT", width=512, height=512)
 
         resized = resize_textures(max_size=1024, force_pot=True)
@@ -116,8 +99,6 @@ class TestResizeTextures:
 
     def test_handles_very_large_images(self) -> None:
         """Should handle very large images."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("HugeImage", width=8192, height=8192)
 
         resized = resize_textures(max_size=512)
@@ -129,8 +110,6 @@ class TestResizeTextures:
 
     def test_handles_very_small_images(self) -> None:
         """Should handle very small images (below max_size)."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("TinyImage", width=64, height=64)
 
         resized = resize_textures(max_size=1024)
@@ -142,8 +121,6 @@ class TestResizeTextures:
 
     def test_handles_non_square_images(self) -> None:
         """Should handle non-square images correctly."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("Portrait", width=512, height=2048)
 
         resized = resize_textures(max_size=1024)
@@ -156,8 +133,6 @@ class TestResizeTextures:
 
     def test_multiple_images_batch_resize(self) -> None:
         """Should resize multiple images in one call."""
-        from notso_glb.cleaners import resize_textures
-
         img1 = bpy.data.images.new("Large1", width=2048, height=2048)
         img2 = bpy.data.images.new("Large2", width=2048, height=2048)
         img3 = bpy.data.images.new("Small", width=512, height=512)
@@ -171,8 +146,6 @@ class TestResizeTextures:
 
     def test_resize_very_small_max_size(self) -> None:
         """Should handle resizing to very small max_size."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("TestImage", width=2048, height=2048)
 
         try:
@@ -185,8 +158,6 @@ class TestResizeTextures:
 
     def test_large_max_size_skips_small_images(self) -> None:
         """Large max_size should skip images already smaller."""
-        from notso_glb.cleaners import resize_textures
-
         img = bpy.data.images.new("SmallImage", width=2048, height=2048)
 
         try:
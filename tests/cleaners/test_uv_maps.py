@@ -1,13 +1,8 @@
 """Tests for UV map cleanup module."""
 
-from typing import cast
-
-from bpy.types import Mesh, Object
-
-
-def _get_mesh_data(obj: Object) -> Mesh:
-    """Get mesh data from an object, assuming obj.type == 'MESH'."""
-    return cast(Mesh, obj.data)
+from bpy.types import Object
+from notso_glb.cleaners import remove_unused_uv_maps
+from notso_glb.utils import get_mesh_data
 
 
 class TestRemoveUnusedUvMaps:
@@ -15,15 +10,11 @@ class TestRemoveUnusedUvMaps:
 
     def test_empty_warnings(self) -> None:
         """Empty warnings should return 0."""
-        from notso_glb.cleaners import remove_unused_uv_maps
-
         assert remove_unused_uv_maps([]) == 0
 
     def test_removes_specified_uv_maps(self, mesh_with_uv_layers: Object) -> None:
         """Should remove UV maps specified in warnings."""
-        from notso_glb.cleaners import remove_unused_uv_maps
-
-        mesh = _get_mesh_data(mesh_with_uv_layers)
+        mesh = get_mesh_data(mesh_with_uv_layers)
         initial_count = len(mesh.uv_layers)
 
         warnings: list[dict[str, object]] = [
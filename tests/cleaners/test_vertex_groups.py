@@ -1,6 +1,7 @@
 """Tests for vertex group cleanup module."""
 
 from bpy.types import Object
+from notso_glb.cleaners import clean_vertex_groups
 
 
 class TestCleanVertexGroups:
@@ -8,20 +9,14 @@ class TestCleanVertexGroups:
 
     def test_no_meshes(self) -> None:
         """Empty scene should return 0 removed."""
-        from notso_glb.cleaners import clean_vertex_groups
-
         assert clean_vertex_groups() == 0
 
     def test_mesh_without_vertex_groups(self, cube_mesh: Object) -> None:
         """Mesh without vertex groups should return 0."""
-        from notso_glb.cleaners import clean_vertex_groups
-
         assert clean_vertex_groups() == 0
 
     def test_removes_empty_vertex_groups(self, cube_mesh: Object) -> None:
         """Empty vertex groups (no weights) should be removed."""
-        from notso_glb.cleaners import clean_vertex_groups
-
         cube_mesh.vertex_groups.new(name="EmptyGroup1")
         cube_mesh.vertex_groups.new(name="EmptyGroup2")
 
@@ -30,8 +25,6 @@ class TestCleanVertexGroups:
 
     def test_keeps_weighted_vertex_groups(self, cube_mesh: Object) -> None:
         """Vertex groups with weights should be kept."""
-        from notso_glb.cleaners import clean_vertex_groups
-
         vg = cube_mesh.vertex_groups.new(name="WeightedGroup")
         vg.add([0, 1, 2], 1.0, "REPLACE")
         cube_mesh.vertex_groups.new(name="EmptyGroup")
@@ -6,6 +6,7 @@ Uses real bpy module (Blender as Python module).
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from typing import cast
 
 import pytest
@@ -37,31 +38,111 @@ def _get_mesh_data(obj: Object) -> Mesh:
     return cast(Mesh, obj.data)
 
 
-@pytest.fixture(autouse=True)
-def reset_blender_scene() -> None:
-    """Reset Blender to factory settings before each test."""
+def _link_object(name: str, mesh: Mesh) -> Object:
+    """Link a new object using ``mesh`` into the scene and make it active."""
+    obj = bpy.data.objects.new(name, mesh)
+    scene = bpy.context.scene
+    if scene is None:
+        raise RuntimeError("No active scene")
+    scene.collection.objects.link(obj)
+    view_layer = bpy.context.view_layer
+    if view_layer is not None:
+        view_layer.objects.active = obj
+    return obj
+
+
+def _new_cube(name: str, subdivisions: int = 0) -> Object:
+    """Build a 2m cube with a ``UVMap`` layer, matching ``primitive_cube_add``.
+
+    Uses bmesh directly, so no operator dispatch or edit-mode round trip.
+    """
+    import bmesh
+
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    bmesh.ops.create_cube(bm, size=2.0, calc_uvs=True)
+    if subdivisions:
+        bmesh.ops.subdivide_edges(
+            bm, edges=bm.edges[:], cuts=subdivisions, use_grid_fill=True
+        )
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return _link_object(name, mesh)
+
+
+# bpy.data collections whose new datablocks are removed after each test.
+# Objects come first so their data has no users left when it is removed.
+_TRACKED_DATA = (
+    "objects",
+    "meshes",
+    "armatures",
+    "materials",
+    "images",
+    "textures",
+    "actions",
+)
+
+
+@pytest.fixture(scope="session")
+def blender_factory_scene() -> None:
+    """Load Blender's empty factory scene once per session."""
     if not HAS_BPY:
         pytest.skip("Blender (bpy) not available")
     bpy.ops.wm.read_factory_settings(use_empty=True)
 
 
+@pytest.fixture(autouse=True)
+def reset_blender_scene(
+    blender_factory_scene: None, request: pytest.FixtureRequest
+) -> Iterator[None]:
+    """Give each test the empty factory scene.
+
+    Removes the datablocks a test created instead of reloading factory
+    settings every time. Tests marked ``full_reset`` still get a reload.
+    """
+    if request.node.get_closest_marker("full_reset"):
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    existing = {
+        name: {item.as_pointer() for item in getattr(bpy.data, name)}
+        for name in _TRACKED_DATA
+    }
+    yield
+    for name in _TRACKED_DATA:
+        collection = getattr(bpy.data, name)
+        created = [
+            item for item in collection if item.as_pointer() not in existing[name]
+        ]
+        for item in created:
+            collection.remove(item)
+
+
 @pytest.fixture
 def cube_mesh() -> Object:
     """Create a simple cube mesh object."""
-    bpy.ops.mesh.primitive_cube_add()
-    return _active_object()
+    return _new_cube("Cube")
+
+
+@pytest.fixture
+def make_named_object() -> Callable[[str], Object]:
+    """Factory for named mesh objects with empty mesh data.
+
+    Cheaper than ``primitive_cube_add`` for tests that only need a name in
+    ``bpy.data.objects``; the mesh datablock shares the object's name.
+    """
+
+    def _make(name: str) -> Object:
+        return _link_object(name, bpy.data.meshes.new(name))
+
+    return _make
 
 
 @pytest.fixture
 def high_poly_mesh() -> Object:
     """Create a high-poly mesh (subdivided cube) for bloat testing."""
-    bpy.ops.mesh.primitive_cube_add()
-    obj = _active_object()
     # Subdivide to increase vertex count
-    bpy.ops.object.mode_set(mode="EDIT")
-    bpy.ops.mesh.subdivide(number_cuts=5)
-    bpy.ops.object.mode_set(mode="OBJECT")
-    return obj
+    return _new_cube("Cube", subdivisions=5)
 
 
 @pytest.fixture
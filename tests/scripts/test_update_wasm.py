@@ -5,12 +5,23 @@ from __future__ import annotations
 import io
 import json
 import tarfile
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 
+def _writes_wasm(data: bytes) -> Callable[[str, Path], int]:
+    """Build a download_wasm stand-in that writes ``data`` to its destination."""
+
+    def download(_tarball_url: str, dest: Path) -> int:
+        _ = dest.write_bytes(data)
+        return len(data)
+
+    return download
+
+
 class TestGetNpmInfo:
     """Tests for get_npm_info function."""
 
@@ -119,7 +130,9 @@ class TestDownloadWasm:
     """Tests for download_wasm function."""
 
     @patch("scripts.update_wasm.urllib.request.urlopen")
-    def test_extracts_wasm_from_tarball(self, mock_urlopen: MagicMock) -> None:
+    def test_extracts_wasm_from_tarball(
+        self, mock_urlopen: MagicMock, tmp_path: Path
+    ) -> None:
         """Should extract library.wasm from npm tarball."""
         from scripts.update_wasm import download_wasm
 
@@ -132,17 +145,40 @@ class TestDownloadWasm:
             tar.addfile(info, io.BytesIO(wasm_data))
         tar_buffer.seek(0)
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = tar_buffer.read()
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        # Streamed response: tarfile reads it incrementally
+        mock_urlopen.return_value = tar_buffer
+
+        dest = tmp_path / "gltfpack.wasm"
+        result = download_wasm("https://example.com/package.tgz", dest)
+
+        assert result == len(wasm_data)
+        assert dest.read_bytes() == wasm_data
+
+    @patch("scripts.update_wasm.urllib.request.urlopen")
+    def test_rejects_member_without_wasm_header(
+        self, mock_urlopen: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should raise ValueError before writing anything for non-WASM data."""
+        from scripts.update_wasm import download_wasm
 
-        result = download_wasm("https://example.com/package.tgz")
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+            info = tarfile.TarInfo(name="package/library.wasm")
+            info.size = 12
+            tar.addfile(info, io.BytesIO(b"invalid data"))
+        tar_buffer.seek(0)
+        mock_urlopen.return_value = tar_buffer
+
+        dest = tmp_path / "gltfpack.wasm"
+        with pytest.raises(ValueError, match="not valid WASM"):
+            download_wasm("https://example.com/package.tgz", dest)
 
-        assert result == wasm_data
+        assert not dest.exists()
 
     @patch("scripts.update_wasm.urllib.request.urlopen")
-    def test_raises_when_wasm_not_found(self, mock_urlopen: MagicMock) -> None:
+    def test_raises_when_wasm_not_found(
+        self, mock_urlopen: MagicMock, tmp_path: Path
+    ) -> None:
         """Should raise FileNotFoundError if WASM not in tarball."""
         from scripts.update_wasm import download_wasm
 
@@ -154,13 +190,11 @@ class TestDownloadWasm:
             tar.addfile(info, io.BytesIO(b"hello"))
         tar_buffer.seek(0)
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = tar_buffer.read()
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        # Streamed response: tarfile reads it incrementally
+        mock_urlopen.return_value = tar_buffer
 
         with pytest.raises(FileNotFoundError, match="library.wasm not found"):
-            download_wasm("https://example.com/package.tgz")
+            download_wasm("https://example.com/package.tgz", tmp_path / "out.wasm")
 
 
 class TestGetBundledVersion:
@@ -208,7 +242,7 @@ class TestUpdateBundle:
 
         mock_get_bundled.return_value = None
         mock_get_version.return_value = ("https://example.com/package.tgz", "1.0.0")
-        mock_download.return_value = b"\x00asm\x01\x00\x00\x00test"
+        mock_download.side_effect = _writes_wasm(b"\x00asm\x01\x00\x00\x00test")
 
         bundle_path = tmp_path / "gltfpack.wasm"
         version_path = tmp_path / "gltfpack.version"
@@ -245,6 +279,34 @@ class TestUpdateBundle:
         assert updated is False
         assert "Already at latest" in msg
 
+    @patch("scripts.update_wasm.download_wasm")
+    @patch("scripts.update_wasm.get_version_info")
+    @patch("scripts.update_wasm.get_bundled_version")
+    def test_redownloads_corrupt_bundle_at_latest_version(
+        self,
+        mock_get_bundled: MagicMock,
+        mock_get_version: MagicMock,
+        mock_download: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Should re-download when the bundled file lacks the WASM header."""
+        from scripts.update_wasm import update_bundle
+
+        mock_get_bundled.return_value = "1.0.0"
+        mock_get_version.return_value = ("https://example.com/package.tgz", "1.0.0")
+        mock_download.side_effect = _writes_wasm(b"\x00asm\x01\x00\x00\x00")
+
+        bundle_path = tmp_path / "gltfpack.wasm"
+        bundle_path.write_bytes(b"")  # e.g. an interrupted earlier update
+        version_path = tmp_path / "gltfpack.version"
+
+        with patch("scripts.update_wasm.BUNDLE_PATH", bundle_path):
+            with patch("scripts.update_wasm.VERSION_PATH", version_path):
+                updated, _ = update_bundle()
+
+        assert updated is True
+        assert bundle_path.read_bytes().startswith(b"\x00asm")
+
     @patch("scripts.update_wasm.download_wasm")
     @patch("scripts.update_wasm.get_version_info")
     @patch("scripts.update_wasm.get_bundled_version")
@@ -260,9 +322,10 @@ class TestUpdateBundle:
 
         mock_get_bundled.return_value = None
         mock_get_version.return_value = ("https://example.com/package.tgz", "1.0.0")
-        mock_download.return_value = b"invalid data"
+        mock_download.side_effect = ValueError("Downloaded file is not valid WASM")
 
         bundle_path = tmp_path / "gltfpack.wasm"
+        bundle_path.write_bytes(b"\x00asm\x01\x00\x00\x00old")
         version_path = tmp_path / "gltfpack.version"
 
         with patch("scripts.update_wasm.BUNDLE_PATH", bundle_path):
@@ -270,6 +333,11 @@ class TestUpdateBundle:
                 with pytest.raises(ValueError, match="not valid WASM"):
                     update_bundle()
 
+        # Existing bundle is kept and no partial download is left behind
+        assert bundle_path.read_bytes() == b"\x00asm\x01\x00\x00\x00old"
+        assert list(tmp_path.iterdir()) == [bundle_path]
+        assert not version_path.exists()
+
     @patch("scripts.update_wasm.download_wasm")
     @patch("scripts.update_wasm.get_version_info")
     @patch("scripts.update_wasm.get_bundled_version")
@@ -285,7 +353,7 @@ class TestUpdateBundle:
 
         mock_get_bundled.return_value = "1.0.0"
         mock_get_version.return_value = ("https://example.com/package.tgz", "1.0.0")
-        mock_download.return_value = b"\x00asm\x01\x00\x00\x00"
+        mock_download.side_effect = _writes_wasm(b"\x00asm\x01\x00\x00\x00")
 
         bundle_path = tmp_path / "gltfpack.wasm"
         version_path = tmp_path / "gltfpack.version"
@@ -419,7 +487,9 @@ class TestEdgeCases:
             get_npm_info()
 
     @patch("scripts.update_wasm.urllib.request.urlopen")
-    def test_handles_empty_tarball(self, mock_urlopen: MagicMock) -> None:
+    def test_handles_empty_tarball(
+        self, mock_urlopen: MagicMock, tmp_path: Path
+    ) -> None:
         """Should handle empty tarball gracefully."""
         from scripts.update_wasm import download_wasm
 
@@ -429,13 +499,11 @@ class TestEdgeCases:
             pass
         tar_buffer.seek(0)
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = tar_buffer.read()
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        # Streamed response: tarfile reads it incrementally
+        mock_urlopen.return_value = tar_buffer
 
         with pytest.raises(FileNotFoundError):
-            download_wasm("https://example.com/package.tgz")
+            download_wasm("https://example.com/package.tgz", tmp_path / "out.wasm")
 
     def test_bundled_version_strips_whitespace(self, tmp_path: Path) -> None:
         """Should strip whitespace from version file."""
@@ -466,7 +534,7 @@ class TestEdgeCases:
         mock_get_version.return_value = ("https://example.com/package.tgz", "2.0.0")
         # Create 10MB WASM (simulating large file)
         large_wasm = b"\x00asm\x01\x00\x00\x00" + b"\x00" * (10 * 1024 * 1024)
-        mock_download.return_value = large_wasm
+        mock_download.side_effect = _writes_wasm(large_wasm)
 
         bundle_path = tmp_path / "gltfpack.wasm"
         version_path = tmp_path / "gltfpack.version"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
@@ -18,6 +19,16 @@ def reset_blender_scene() -> None:
     pass
 
 
+@pytest.fixture(autouse=True)
+def clear_availability_cache() -> Iterator[None]:
+    """Clear memoized is_available() so per-test path patches take effect."""
+    from notso_glb.wasm import is_available
+
+    is_available.cache_clear()
+    yield
+    is_available.cache_clear()
+
+
 @pytest.fixture
 def mock_wasi_fs() -> WasiFilesystem:
     """Create a WasiFilesystem with mocked _refresh_memory for testing.
@@ -75,8 +75,8 @@ class TestInitFds:
 
         assert 1 in fs._fds  # stdout
         assert 2 in fs._fds  # stderr
-        assert fs._fds[1]["type"] == "output"
-        assert fs._fds[2]["type"] == "output"
+        assert fs._fds[1].kind == "output"
+        assert fs._fds[2].kind == "output"
 
     def test_creates_mount_points(self) -> None:
         """Should create mount point file descriptors."""
@@ -87,8 +87,8 @@ class TestInitFds:
 
         assert 3 in fs._fds
         assert 4 in fs._fds
-        assert "mount" in fs._fds[3]
-        assert "mount" in fs._fds[4]
+        assert fs._fds[3].mount
+        assert fs._fds[4].mount
 
     def test_resets_output_buffer(self) -> None:
         """Should reset output buffer."""
@@ -117,16 +117,32 @@ class TestNextFd:
 
     def test_skips_existing_fds(self) -> None:
         """Should skip existing file descriptors."""
-        from notso_glb.wasm.wasi import WasiFilesystem
+        from notso_glb.wasm.wasi import FdEntry, WasiFilesystem
 
         fs = WasiFilesystem()
         fs._init_fds()
-        fs._fds[5] = {"test": "data"}
+        fs._fds[5] = FdEntry()
 
         fd = fs._next_fd()
 
         assert fd != 5
 
+    def test_reuses_closed_fd(self) -> None:
+        """Should hand out a closed descriptor again before new ones."""
+        from notso_glb.wasm.wasi import FdEntry, WasiFilesystem
+
+        fs = WasiFilesystem()
+        fs._init_fds()
+        first = fs._next_fd()
+        fs._fds[first] = FdEntry()
+        second = fs._next_fd()
+        fs._fds[second] = FdEntry()
+
+        fs.wasi_fd_close(first)
+
+        assert fs._next_fd() == first
+        assert fs._next_fd() == second + 1
+
 
 class TestMemoryAccess:
     """Tests for memory access methods."""
@@ -191,13 +207,41 @@ class TestMemoryAccess:
 
         assert value == 0x12345678
 
-    def test_get_string_decodes_utf8(self, mock_wasi_fs: WasiFilesystem) -> None:
-        """Should decode UTF-8 string from memory."""
+    def test_get_bytes_reads_raw_bytes(self, mock_wasi_fs: WasiFilesystem) -> None:
+        """Should read raw bytes from memory."""
         mock_wasi_fs._memory_array = bytearray(b"Hello\x00World")  # type: ignore[assignment]
 
-        text = mock_wasi_fs._get_string(0, 5)
+        data = mock_wasi_fs._get_bytes(0, 5)
+
+        assert data == b"Hello"
+
+    def test_refresh_memory_reuses_view_until_memory_grows(self) -> None:
+        """Should rebuild the view only when linear memory changes size."""
+        import ctypes
+        from unittest.mock import MagicMock
+
+        from notso_glb.wasm.wasi import WasiFilesystem
+
+        backing = (ctypes.c_ubyte * 128)()
+        memory = MagicMock()
+        memory.data_ptr.return_value = ctypes.cast(
+            backing, ctypes.POINTER(ctypes.c_ubyte)
+        )
+        memory.data_len.return_value = 64
+
+        fs = WasiFilesystem()
+        fs._memory = memory
+
+        fs._refresh_memory()
+        first = fs._memory_array
+        fs._refresh_memory()
+        assert fs._memory_array is first
 
-        assert text == "Hello"
+        memory.data_len.return_value = 128  # grown in place
+        fs._refresh_memory()
+        assert fs._memory_array is not first
+        assert fs._memory_array is not None
+        assert len(fs._memory_array) == 128
 
 
 class TestWasiSyscalls:
@@ -216,11 +260,11 @@ class TestWasiSyscalls:
 
     def test_fd_close_removes_fd(self) -> None:
         """Should remove file descriptor."""
-        from notso_glb.wasm.wasi import WasiFilesystem
+        from notso_glb.wasm.wasi import FdEntry, WasiFilesystem
 
         fs = WasiFilesystem()
         fs._init_fds()
-        fs._fds[10] = {"test": "data"}
+        fs._fds[10] = FdEntry()
 
         result = fs.wasi_fd_close(10)
 
@@ -265,6 +309,49 @@ class TestWasiSyscalls:
         # Check filetype is directory (3)
         assert mock_wasi_fs._memory_array[0] == 3  # type: ignore[index]
 
+    def test_fd_fdstat_get_clears_flags_and_rights(
+        self, mock_wasi_fs: WasiFilesystem
+    ) -> None:
+        """Should write the whole 24-byte fdstat, zeroing flags and rights."""
+        mock_wasi_fs._init_fds()
+        mock_wasi_fs._memory_array = bytearray(b"\xff" * 32)  # type: ignore[assignment]
+
+        result = mock_wasi_fs.wasi_fd_fdstat_get(1, 0)
+
+        assert result == 0
+        assert mock_wasi_fs._memory_array[0] == 2  # type: ignore[index]
+        assert bytes(mock_wasi_fs._memory_array[2:24]) == bytes(22)  # type: ignore[index]
+        assert bytes(mock_wasi_fs._memory_array[24:]) == b"\xff" * 8  # type: ignore[index]
+
+    def test_path_filestat_get_writes_zeroed_filestat(
+        self, mock_wasi_fs: WasiFilesystem
+    ) -> None:
+        """Should write a 64-byte filestat with only the filetype set."""
+        mock_wasi_fs._init_fds()
+        mock_wasi_fs._memory_array = bytearray(b"\xff" * 136)  # type: ignore[assignment]
+        mock_wasi_fs._memory_array[0:1] = b"."  # type: ignore[index]
+
+        result = mock_wasi_fs.wasi_path_filestat_get(3, 0, 0, 1, 64)
+
+        assert result == 0
+        stat = bytes(mock_wasi_fs._memory_array[64:128])  # type: ignore[index]
+        assert stat[16] == 3  # directory
+        assert stat[:16] + stat[17:] == bytes(63)
+        assert bytes(mock_wasi_fs._memory_array[128:]) == b"\xff" * 8  # type: ignore[index]
+
+    def test_fd_prestat_get_writes_mount_length(
+        self, mock_wasi_fs: WasiFilesystem
+    ) -> None:
+        """Should write a dir-tagged prestat with the mount name length."""
+        mock_wasi_fs._init_fds()
+        mock_wasi_fs._memory_array = bytearray(b"\xff" * 8)  # type: ignore[assignment]
+
+        result = mock_wasi_fs.wasi_fd_prestat_get(4, 0)
+
+        assert result == 0
+        assert bytes(mock_wasi_fs._memory_array[:4]) == bytes(4)  # type: ignore[index]
+        assert mock_wasi_fs._get_u32(4) == len("/gltfpack-$pwd")
+
     def test_fd_write_appends_to_output_buffer(
         self, mock_wasi_fs: WasiFilesystem
     ) -> None:
@@ -285,17 +372,39 @@ class TestWasiSyscalls:
         assert mock_wasi_fs._output_buffer == b"Hello"
         assert mock_wasi_fs._get_u32(20) == 5  # bytes written
 
+    def test_fd_write_gathers_multiple_iovecs(
+        self, mock_wasi_fs: WasiFilesystem
+    ) -> None:
+        """Should write every iovec in order and report the total."""
+        mock_wasi_fs._init_fds()
+        mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
+        mock_wasi_fs._memory_array[0:11] = b"Hello World"  # type: ignore[index]
+
+        # Two iovecs: [ptr=6, len=5], [ptr=5, len=1]
+        mock_wasi_fs._set_u32(20, 6)
+        mock_wasi_fs._set_u32(24, 5)
+        mock_wasi_fs._set_u32(28, 5)
+        mock_wasi_fs._set_u32(32, 1)
+
+        result = mock_wasi_fs.wasi_fd_write(1, 20, 2, 40)
+
+        assert result == 0
+        assert mock_wasi_fs._output_buffer == b"World "
+        assert mock_wasi_fs._get_u32(40) == 6
+
     def test_fd_read_reads_from_file(self, mock_wasi_fs: WasiFilesystem) -> None:
         """Should read from file data."""
+        from notso_glb.wasm.wasi import FdEntry
+
         mock_wasi_fs._init_fds()
         mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
 
         # Set up a file descriptor with data
-        mock_wasi_fs._fds[10] = {
-            "data": bytearray(b"Test data"),
-            "size": 9,
-            "position": 0,
-        }
+        mock_wasi_fs._fds[10] = FdEntry(
+            data=bytearray(b"Test data"),
+            size=9,
+            position=0,
+        )
 
         # Set up iovec: [ptr=50, len=5]
         mock_wasi_fs._set_u32(0, 50)  # buffer ptr
@@ -306,48 +415,81 @@ class TestWasiSyscalls:
         assert result == 0
         assert bytes(mock_wasi_fs._memory_array[50:55]) == b"Test "  # type: ignore[index]
         assert mock_wasi_fs._get_u32(10) == 5  # bytes read
-        assert mock_wasi_fs._fds[10]["position"] == 5
+        assert mock_wasi_fs._fds[10].position == 5
+
+    def test_fd_read_scatters_multiple_iovecs(
+        self, mock_wasi_fs: WasiFilesystem
+    ) -> None:
+        """Should fill each iovec in turn and release the source buffer."""
+        from notso_glb.wasm.wasi import FdEntry
+
+        mock_wasi_fs._init_fds()
+        mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
+        data = bytearray(b"Test data")
+        mock_wasi_fs._fds[10] = FdEntry(data=data, size=9, position=0)
+
+        # Two iovecs: [ptr=50, len=4], [ptr=60, len=10]
+        mock_wasi_fs._set_u32(0, 50)
+        mock_wasi_fs._set_u32(4, 4)
+        mock_wasi_fs._set_u32(8, 60)
+        mock_wasi_fs._set_u32(12, 10)
+
+        result = mock_wasi_fs.wasi_fd_read(10, 0, 2, 20)
+
+        assert result == 0
+        assert bytes(mock_wasi_fs._memory_array[50:54]) == b"Test"  # type: ignore[index]
+        assert bytes(mock_wasi_fs._memory_array[60:65]) == b" data"  # type: ignore[index]
+        assert mock_wasi_fs._get_u32(20) == 9
+        assert mock_wasi_fs._fds[10].position == 9
+        data.extend(b"!")  # BufferError if a view were still exported
 
     def test_fd_seek_updates_position(self, mock_wasi_fs: WasiFilesystem) -> None:
         """Should update file position."""
+        from notso_glb.wasm.wasi import FdEntry
+
         mock_wasi_fs._init_fds()
         mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
-        mock_wasi_fs._fds[10] = {"size": 100, "position": 0}
+        mock_wasi_fs._fds[10] = FdEntry(size=100, position=0)
 
         result = mock_wasi_fs.wasi_fd_seek32(10, 50, 0, 0)  # SEEK_SET
 
         assert result == 0
-        assert mock_wasi_fs._fds[10]["position"] == 50
+        assert mock_wasi_fs._fds[10].position == 50
 
     def test_fd_seek_seek_cur(self, mock_wasi_fs: WasiFilesystem) -> None:
         """Should seek relative to current position."""
+        from notso_glb.wasm.wasi import FdEntry
+
         mock_wasi_fs._init_fds()
         mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
-        mock_wasi_fs._fds[10] = {"size": 100, "position": 20}
+        mock_wasi_fs._fds[10] = FdEntry(size=100, position=20)
 
         result = mock_wasi_fs.wasi_fd_seek32(10, 10, 1, 0)  # SEEK_CUR
 
         assert result == 0
-        assert mock_wasi_fs._fds[10]["position"] == 30
+        assert mock_wasi_fs._fds[10].position == 30
 
     def test_fd_seek_seek_end(self, mock_wasi_fs: WasiFilesystem) -> None:
         """Should seek relative to end."""
+        from notso_glb.wasm.wasi import FdEntry
+
         mock_wasi_fs._init_fds()
         mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
-        mock_wasi_fs._fds[10] = {"size": 100, "position": 0}
+        mock_wasi_fs._fds[10] = FdEntry(size=100, position=0)
 
         result = mock_wasi_fs.wasi_fd_seek32(10, -10, 2, 0)  # SEEK_END
 
         assert result == 0
-        assert mock_wasi_fs._fds[10]["position"] == 90
+        assert mock_wasi_fs._fds[10].position == 90
 
     def test_fd_seek_validates_bounds(self, mock_wasi_fs: WasiFilesystem) -> None:
         """Should validate seek position bounds."""
         from notso_glb.wasm.constants import WASI_EINVAL
+        from notso_glb.wasm.wasi import FdEntry
 
         mock_wasi_fs._init_fds()
         mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
-        mock_wasi_fs._fds[10] = {"size": 100, "position": 0}
+        mock_wasi_fs._fds[10] = FdEntry(size=100, position=0)
 
         result = mock_wasi_fs.wasi_fd_seek32(10, -10, 0, 0)  # Negative position
 
@@ -375,21 +517,59 @@ class TestWasiSyscalls:
 
         assert result == WASI_ENOSYS
 
+    def test_path_open_reads_input_without_copying(
+        self, mock_wasi_fs: WasiFilesystem
+    ) -> None:
+        """Should serve a read-open straight from the virtual file's buffer."""
+        mock_wasi_fs._init_fds()
+        mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
+        input_data = b"glTF input"
+        mock_wasi_fs._fs_interface = {b"in.glb": input_data}
+        mock_wasi_fs._memory_array[0:6] = b"in.glb"  # type: ignore[index]
+
+        result = mock_wasi_fs.wasi_path_open32(4, 0, 0, 6, 0, 0, 0, 0, 50)
+
+        assert result == 0
+        fd = mock_wasi_fs._get_u32(50)
+        assert mock_wasi_fs._fds[fd].data is input_data
+        assert mock_wasi_fs._fds[fd].size == len(input_data)
+
+    def test_fd_write_rejects_read_only_file(
+        self, mock_wasi_fs: WasiFilesystem
+    ) -> None:
+        """Should return EBADF when writing to a file opened for reading."""
+        from notso_glb.wasm.constants import WASI_EBADF
+        from notso_glb.wasm.wasi import FdEntry
+
+        mock_wasi_fs._init_fds()
+        mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
+        mock_wasi_fs._fds[10] = FdEntry(data=b"input", size=5, position=0)
+
+        mock_wasi_fs._set_u32(60, 0)  # buffer ptr
+        mock_wasi_fs._set_u32(64, 2)  # buffer len
+
+        result = mock_wasi_fs.wasi_fd_write(10, 60, 1, 80)
+
+        assert result == WASI_EBADF
+        assert mock_wasi_fs._fds[10].data == b"input"
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
     def test_fd_write_grows_file_buffer(self, mock_wasi_fs: WasiFilesystem) -> None:
         """Should grow file buffer when writing beyond capacity."""
+        from notso_glb.wasm.wasi import FdEntry
+
         mock_wasi_fs._init_fds()
         mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
 
         # Small initial buffer
-        mock_wasi_fs._fds[10] = {
-            "data": bytearray(10),
-            "size": 0,
-            "position": 0,
-        }
+        mock_wasi_fs._fds[10] = FdEntry(
+            data=bytearray(10),
+            size=0,
+            position=0,
+        )
 
         # Write 50 bytes
         mock_wasi_fs._memory_array[0:50] = b"X" * 50  # type: ignore[index]
@@ -399,18 +579,40 @@ class TestEdgeCases:
         result = mock_wasi_fs.wasi_fd_write(10, 60, 1, 70)
 
         assert result == 0
-        assert len(mock_wasi_fs._fds[10]["data"]) >= 50
+        assert len(mock_wasi_fs._fds[10].data) >= 50
+
+    def test_fd_write_past_end_zero_fills_gap(
+        self, mock_wasi_fs: WasiFilesystem
+    ) -> None:
+        """Should zero-fill when writing after seeking beyond the data."""
+        from notso_glb.wasm.wasi import FdEntry
+
+        mock_wasi_fs._init_fds()
+        mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
+        mock_wasi_fs._memory_array[0:2] = b"AB"  # type: ignore[index]
+        mock_wasi_fs._fds[10] = FdEntry(data=bytearray(), size=0, position=4)
+
+        mock_wasi_fs._set_u32(60, 0)  # buffer ptr
+        mock_wasi_fs._set_u32(64, 2)  # buffer len
+
+        result = mock_wasi_fs.wasi_fd_write(10, 60, 1, 70)
+
+        assert result == 0
+        assert mock_wasi_fs._fds[10].data == b"\x00\x00\x00\x00AB"
+        assert mock_wasi_fs._fds[10].size == 6
 
     def test_fd_read_at_eof(self, mock_wasi_fs: WasiFilesystem) -> None:
         """Should handle read at EOF."""
+        from notso_glb.wasm.wasi import FdEntry
+
         mock_wasi_fs._init_fds()
         mock_wasi_fs._memory_array = bytearray(100)  # type: ignore[assignment]
 
-        mock_wasi_fs._fds[10] = {
-            "data": bytearray(b"Test"),
-            "size": 4,
-            "position": 4,  # At EOF
-        }
+        mock_wasi_fs._fds[10] = FdEntry(
+            data=bytearray(b"Test"),
+            size=4,
+            position=4,  # At EOF
+        )
 
         mock_wasi_fs._set_u32(0, 50)  # buffer ptr
         mock_wasi_fs._set_u32(4, 10)  # buffer len
@@ -421,31 +623,31 @@ class TestEdgeCases:
         assert mock_wasi_fs._get_u32(10) == 0  # 0 bytes read
 
     def test_handles_unicode_in_strings(self, mock_wasi_fs: WasiFilesystem) -> None:
-        """Should handle Unicode strings."""
+        """Should pass UTF-8 encoded names through unchanged."""
         unicode_text = "Hello 世界 🌍"
         encoded = unicode_text.encode("utf-8")
         mock_wasi_fs._memory_array = bytearray(len(encoded))  # type: ignore[assignment]
         mock_wasi_fs._memory_array[:] = encoded  # type: ignore[index]
 
-        text = mock_wasi_fs._get_string(0, len(encoded))
+        data = mock_wasi_fs._get_bytes(0, len(encoded))
 
-        assert text == unicode_text
+        assert data.decode("utf-8") == unicode_text
 
     def test_fd_close_with_close_data_flag(self) -> None:
         """Should save file data when close_data flag is set."""
-        from notso_glb.wasm.wasi import WasiFilesystem
+        from notso_glb.wasm.wasi import FdEntry, WasiFilesystem
 
         fs = WasiFilesystem()
         fs._init_fds()
         fs._fs_interface = {}
-        fs._fds[10] = {
-            "name": "output.glb",
-            "data": bytearray(b"test data"),
-            "size": 9,
-            "close_data": True,
-        }
+        fs._fds[10] = FdEntry(
+            name=b"output.glb",
+            data=bytearray(b"test data"),
+            size=9,
+            close_data=True,
+        )
 
         result = fs.wasi_fd_close(10)
 
         assert result == 0
-        assert fs._fs_interface["output.glb"] == b"test data"
+        assert fs._fs_interface[b"output.glb"] == b"test data"
@@ -54,6 +54,19 @@ class TestIsAvailable:
 
         assert result is False
 
+    @patch("notso_glb.wasm._get_wasm_path")
+    def test_caches_result(self, mock_get_path: MagicMock, tmp_path: Path) -> None:
+        """Should resolve availability once and reuse the result."""
+        from notso_glb.wasm import is_available
+
+        mock_get_path.return_value = tmp_path / "nonexistent.wasm"
+
+        first = is_available()
+        second = is_available()
+
+        assert first is second
+        assert mock_get_path.call_count <= 1
+
 
 class TestGetGltfpack:
     """Tests for get_gltfpack singleton function."""
@@ -75,6 +88,82 @@ class TestGetGltfpack:
 
         assert instance1 is instance2
 
+    def test_returns_separate_instance_per_thread(self) -> None:
+        """Should give each thread its own instance (pack() is stateful)."""
+        import threading
+
+        from notso_glb.wasm import get_gltfpack
+
+        main_instance = get_gltfpack()
+        other: list[object] = []
+        thread = threading.Thread(target=lambda: other.append(get_gltfpack()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_instance
+
+
+class TestPackMany:
+    """Tests for pack_many batch function."""
+
+    @patch("notso_glb.wasm.runner.get_gltfpack")
+    def test_packs_each_file_in_input_order(
+        self, mock_get_gltfpack: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should pack every input and return results in input order."""
+        from notso_glb.wasm import pack_many
+
+        inputs = []
+        for name in ("a.glb", "b.glb", "c.glb"):
+            path = tmp_path / name
+            path.write_bytes(name.encode())
+            inputs.append(path)
+
+        mock_instance = MagicMock()
+        mock_instance.pack.side_effect = lambda data, **_: (True, bytes(data), "ok")
+        mock_get_gltfpack.return_value = mock_instance
+
+        results = pack_many(inputs, max_workers=2, texture_compress=False)
+
+        assert [path for _, path, _ in results] == [
+            tmp_path / "a_packed.glb",
+            tmp_path / "b_packed.glb",
+            tmp_path / "c_packed.glb",
+        ]
+        assert all(success for success, _, _ in results)
+        assert (tmp_path / "b_packed.glb").read_bytes() == b"b.glb"
+
+
+class TestPrewarm:
+    """Tests for prewarm background compilation."""
+
+    @patch("notso_glb.wasm.is_available")
+    def test_returns_none_when_unavailable(self, mock_is_avail: MagicMock) -> None:
+        """Should not start a thread when WASM cannot be used."""
+        from notso_glb.wasm import prewarm
+
+        mock_is_avail.return_value = False
+
+        assert prewarm() is None
+
+    @patch("notso_glb.wasm.is_available")
+    @patch("notso_glb.wasm.runtime._get_compiled_module")
+    def test_compiles_module_in_daemon_thread(
+        self, mock_compile: MagicMock, mock_is_avail: MagicMock
+    ) -> None:
+        """Should compile the module off the calling thread, swallowing errors."""
+        from notso_glb.wasm import prewarm
+
+        mock_is_avail.return_value = True
+        mock_compile.side_effect = RuntimeError("compile failed")
+
+        thread = prewarm()
+
+        assert thread is not None
+        assert thread.daemon
+        thread.join()
+        mock_compile.assert_called_once_with()
+
 
 class TestRunGltfpackWasm:
     """Tests for run_gltfpack_wasm function."""
@@ -187,6 +276,29 @@ class TestRunGltfpackWasm:
         args = call_args[1]["args"]
         assert "-cc" in args
 
+    @patch("notso_glb.wasm.is_available")
+    @patch("notso_glb.wasm.runner.get_gltfpack")
+    def test_reuses_args_for_same_flag_set(
+        self, mock_get_gltfpack: MagicMock, mock_is_avail: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should build the args once per flag combination."""
+        from notso_glb.wasm import run_gltfpack_wasm
+
+        mock_is_avail.return_value = True
+        input_path = tmp_path / "model.glb"
+        input_path.write_bytes(b"\x00asm")
+
+        mock_instance = MagicMock()
+        mock_instance.pack.return_value = (True, b"output", "Success")
+        mock_get_gltfpack.return_value = mock_instance
+
+        run_gltfpack_wasm(input_path, simplify_ratio=0.5)
+        run_gltfpack_wasm(input_path, simplify_ratio=0.5)
+
+        first, second = (c[1]["args"] for c in mock_instance.pack.call_args_list)
+        assert first == ("-cc", "-si", "0.5")
+        assert second is first
+
     @patch("notso_glb.wasm.is_available")
     @patch("notso_glb.wasm.runner.get_gltfpack")
     def test_skips_texture_compress_with_warning(
@@ -297,3 +409,44 @@ class TestRunGltfpackWasm:
         assert success is True
         assert output_path.exists()
         assert output_path.read_bytes() == b"packed_data"
+
+    @patch("notso_glb.wasm.is_available")
+    @patch("notso_glb.wasm.runner.get_gltfpack")
+    def test_passes_empty_bytes_for_empty_input(
+        self, mock_get_gltfpack: MagicMock, mock_is_avail: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should fall back to empty bytes since empty files cannot be mmapped."""
+        from notso_glb.wasm import run_gltfpack_wasm
+
+        mock_is_avail.return_value = True
+        input_path = tmp_path / "model.glb"
+        input_path.write_bytes(b"")
+
+        mock_instance = MagicMock()
+        mock_instance.pack.return_value = (False, b"", "Pack failed")
+        mock_get_gltfpack.return_value = mock_instance
+
+        run_gltfpack_wasm(input_path)
+
+        assert mock_instance.pack.call_args[0][0] == b""
+
+    @patch("notso_glb.wasm.is_available")
+    @patch("notso_glb.wasm.runner.get_gltfpack")
+    def test_handles_wasm_error(
+        self, mock_get_gltfpack: MagicMock, mock_is_avail: MagicMock, tmp_path: Path
+    ) -> None:
+        """Should report WASM-level errors instead of raising."""
+        from notso_glb.wasm import run_gltfpack_wasm
+
+        mock_is_avail.return_value = True
+        input_path = tmp_path / "model.glb"
+        input_path.write_bytes(b"\x00asm")
+
+        mock_instance = MagicMock()
+        mock_instance.pack.side_effect = RuntimeError("wasm trap")
+        mock_get_gltfpack.return_value = mock_instance
+
+        success, _, msg = run_gltfpack_wasm(input_path)
+
+        assert success is False
+        assert "WASM error" in msg